@@ -0,0 +1,125 @@
+"""Benchmarks for Core over a synthetic catalog: python -m benchmarks
+
+Generates a catalog of the given shape, times Core's hot paths over it, and
+optionally saves the results as JSON and compares them to a saved baseline.
+Exits with 1 if anything is slower than the baseline by more than the
+tolerance."""
+
+import argparse
+import json
+import platform
+import shutil
+import sys
+import tempfile
+import time
+
+from catalog import CatalogShape, generateCatalog
+from suite import coreBenchmarks, loadedCore, treeMemory
+
+def parseArgs(argv):
+    shape = CatalogShape()
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+        description="Time Core over a synthetic catalog.")
+    parser.add_argument("--items", type=int, default=shape.items,
+        help="number of info files (default: %(default)s)")
+    parser.add_argument("--depth", type=int, default=shape.depth,
+        help="levels of categories (default: %(default)s)")
+    parser.add_argument("--fanout", type=int, default=shape.fanout,
+        help="categories each item is in (default: %(default)s)")
+    parser.add_argument("--density", type=float, default=shape.density,
+        help="average dependencies per item (default: %(default)s)")
+    parser.add_argument("--presets", type=int, default=shape.presets,
+        help="number of presets (default: %(default)s)")
+    parser.add_argument("--helpsize", type=int, default=shape.helpsize,
+        help="words of help text per item (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=shape.seed)
+    parser.add_argument("-r", "--repeat", type=int, default=5,
+        help="times to run each benchmark (default: %(default)s)")
+    parser.add_argument("-k", "--only", action="append", default=[],
+        help="only run benchmarks with this in their name, may be repeated")
+    parser.add_argument("-o", "--output", help="save the results to this JSON file")
+    parser.add_argument("-b", "--baseline", help="compare against results saved earlier")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+        help="slowdown against the baseline counted as a regression (default: %(default)s)")
+
+    return parser.parse_args(argv)
+
+def compare(results, baseline, tolerance):
+    # [(name, baseline median, median, ratio, regressed), ...] for benchmarks
+    # in both
+    rows = []
+
+    for name, result in sorted(results.items()):
+        if not name in baseline:
+            continue
+
+        old = baseline[name]["median"]
+        ratio = result["median"] / old if old else 1.0
+        rows.append((name, old, result["median"], ratio, ratio > 1 + tolerance))
+
+    return rows
+
+def main(argv=None):
+    args = parseArgs(sys.argv[1:] if argv is None else argv)
+    shape = CatalogShape(args.items, args.depth, args.fanout, args.density,
+                         args.presets, helpsize=args.helpsize, seed=args.seed)
+    root = tempfile.mkdtemp(prefix="pynstaller-bench-")
+    cachedir = None
+
+    try:
+        start = time.time()
+        installerdir, presetdir = generateCatalog(root, shape)
+        print "Generated %d items and %d presets in %.1fs" % (shape.items, shape.presets, time.time() - start)
+
+        memory = treeMemory(loadedCore(installerdir, presetdir))
+        print "  %-20s %10.1f KB total %10d bytes per item" % ("tree memory",
+            memory / 1024.0, memory // max(1, shape.items))
+
+        benchmarks, cachedir = coreBenchmarks(installerdir, presetdir)
+        results = {}
+
+        for benchmark in benchmarks:
+            if args.only and not [x for x in args.only if x in benchmark.name]:
+                continue
+
+            results[benchmark.name] = result = benchmark.measure(args.repeat)
+            print "  %-20s %10.2f ms median %10.2f ms best" % (benchmark.name,
+                result["median"] * 1000, result["best"] * 1000)
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+        if cachedir is not None:
+            shutil.rmtree(cachedir, ignore_errors=True)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"shape": shape.toDict(), "repeat": args.repeat,
+                       "python": platform.python_version(), "platform": sys.platform,
+                       "when": time.time(), "memory": memory, "results": results},
+                      f, indent=1, sort_keys=True)
+
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+
+    if baseline.get("shape") != shape.toDict():
+        print "Warning: the baseline was run over a different catalog shape"
+
+    if baseline.get("memory"):
+        print "  %-20s %10.1f KB -> %10.1f KB %+7.1f%%" % ("tree memory", baseline["memory"] / 1024.0,
+            memory / 1024.0, (float(memory) / baseline["memory"] - 1) * 100)
+
+    regressed = False
+    print "Against %s:" % args.baseline
+
+    for name, old, new, ratio, slower in compare(results, baseline["results"], args.tolerance):
+        print "  %-20s %10.2f ms -> %10.2f ms %+7.1f%%%s" % (name, old * 1000, new * 1000,
+            (ratio - 1) * 100, "  REGRESSION" if slower else "")
+        regressed = regressed or slower
+
+    return 1 if regressed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
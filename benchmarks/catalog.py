@@ -0,0 +1,81 @@
+import os
+import random
+
+# Sub-categories under each category
+WIDTH = 8
+
+WORDS = ("lorem ipsum dolor sit amet consectetur adipiscing elit sed do eiusmod "
+         "tempor incididunt ut labore et dolore magna aliqua").split()
+
+class CatalogShape(object):
+    """What a synthetic catalog looks like"""
+    def __init__(self, items=2000, depth=3, fanout=2, density=1.0, presets=10,
+                 commands=3, helpsize=200, seed=0):
+        self.items = items # Number of info files
+        self.depth = depth # Levels of categories above each item
+        self.fanout = fanout # Categories each item appears in
+        self.density = density # Average dependencies per item
+        self.presets = presets # Number of preset files
+        self.commands = commands # Commands per item
+        self.helpsize = helpsize # Words of help text per item
+        self.seed = seed
+
+    def toDict(self):
+        return dict(self.__dict__)
+
+def itemId(n):
+    return "item%05d" % n
+
+def generateCatalog(root, shape):
+    # Write an Installers and a Presets directory under root, returning
+    # their paths. The same shape always gives the same catalog.
+    rng = random.Random(shape.seed)
+    installerdir = os.path.join(root, "Installers")
+    presetdir = os.path.join(root, "Presets")
+    ids = [itemId(n) for n in range(shape.items)]
+
+    for n, id in enumerate(ids):
+        cats = []
+
+        for x in range(max(1, shape.fanout)):
+            cats.append("/".join("Category%d" % rng.randrange(WIDTH) for y in range(max(1, shape.depth))))
+
+        # Only depend on earlier items, so there are never any cycles
+        count = int(shape.density) + (rng.random() < shape.density % 1)
+        depends = rng.sample(ids[:n], min(n, count))
+
+        directory = os.path.join(installerdir, cats[0], id)
+        os.makedirs(directory)
+
+        with open(os.path.join(directory, "%s.info" % id), "w") as f:
+            f.write("[Core]\n")
+            f.write("name = Item %d\n" % n)
+            f.write("id = %s\n" % id)
+            f.write("categories = %s\n" % ", ".join(cats))
+            f.write("summary = Synthetic item number %d\n" % n)
+            f.write("tooltip = Installs item %d\n" % n)
+            f.write("helptext = %s\n" % " ".join(rng.choice(WORDS) for x in range(shape.helpsize)))
+
+            if depends:
+                f.write("depends = %s\n" % ", ".join(depends))
+
+            f.write("\n[Commands]\n")
+
+            for x in range(shape.commands):
+                f.write("%d = echo step %d of %s\n" % (x + 1, x + 1, id))
+
+    os.makedirs(presetdir)
+    size = max(1, shape.items // 10)
+
+    for n in range(shape.presets):
+        includes = rng.sample(ids, min(len(ids), size))
+        excludes = rng.sample(ids, min(len(ids), size // 10))
+
+        with open(os.path.join(presetdir, "preset%03d.preset" % n), "w") as f:
+            f.write("[Core]\n")
+            f.write("name = Preset %d\n" % n)
+            f.write("id = preset%03d\n" % n)
+            f.write("includes = %s\n" % ", ".join(includes))
+            f.write("excludes = %s\n" % ", ".join(excludes))
+
+    return installerdir, presetdir
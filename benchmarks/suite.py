@@ -0,0 +1,132 @@
+import gc
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+import types
+
+from installer.core import Core
+from installer.infoparser import readInfo, readConfigParser, ITEMKEYS
+
+class Benchmark(object):
+    """Something to time. setup, if given, runs untimed before each run and
+    its result is passed to func."""
+    def __init__(self, name, func, setup=None):
+        self.name = name
+        self.func = func
+        self.setup = setup
+
+    def measure(self, repeat):
+        times = []
+
+        for x in range(repeat):
+            state = self.setup() if self.setup is not None else None
+            gc.collect()
+            gc.disable()
+
+            try:
+                start = timeit.default_timer()
+                self.func(state)
+                times.append(timeit.default_timer() - start)
+            finally:
+                gc.enable()
+
+        times.sort()
+        return {"best": times[0], "median": times[len(times) // 2], "runs": repeat}
+
+def reachable(roots, ignore=()):
+    # { id(object): object } of everything reachable from roots, short of
+    # classes, modules and functions, and anything in ignore
+    seen = {}
+    pending = list(roots)
+    stop = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType)
+
+    while pending:
+        obj = pending.pop()
+
+        if id(obj) in seen or id(obj) in ignore or isinstance(obj, stop):
+            continue
+
+        seen[id(obj)] = obj
+        pending.extend(gc.get_referents(obj))
+
+    return seen
+
+def treeMemory(core):
+    # Bytes used by the item tree and index, over and above the parsed file
+    # data they're built from
+    ignore = reachable(core._files.values())
+    objects = reachable([core.rootItem(), core.installerItems(), core.categories], ignore)
+    return sum(sys.getsizeof(x) for x in objects.values())
+
+def loadedCore(installerdir, presetdir, usecache=False):
+    core = Core(usecache=usecache)
+    core.getItems(installerdir)
+    core.getPresets(presetdir)
+    return core
+
+def coreBenchmarks(installerdir, presetdir):
+    # The hot paths of Core, over an already generated catalog
+    cachedir = tempfile.mkdtemp(prefix="pynstaller-cache-")
+    cachedinstallers = os.path.join(cachedir, "Installers")
+    shutil.copytree(installerdir, cachedinstallers)
+    core = loadedCore(installerdir, presetdir)
+    items = core.installerItems()
+    ids = sorted(items)
+    presets = sorted(core.presetItems())
+    files = list(core._files.values())
+    categories = [x for x in core.categories if not "/" in x]
+    filenames = sorted(core._files)
+
+    # Leave the cache warm for the cached scan
+    Core().getItems(cachedinstallers)
+
+    def unplaced():
+        core.cleanUpItems()
+
+        for data in files:
+            core.addItemData(data)
+
+        return core
+
+    def invalidated():
+        core.installerItems().invalidate()
+        return core.installerItems()
+
+    def cleared():
+        core.installerItems().setAllChecked(False)
+        return core.installerItems()
+
+    def resolveAll(items):
+        for id in ids:
+            items.deps(id)
+
+    def applyAll(state):
+        for id in presets:
+            core.applyPreset(id)
+
+    def checkAll(items):
+        for id in ids:
+            items.setChecked(id, True)
+
+    def checkCategories(state):
+        for path in categories:
+            core.setCategoryChecked(path, True)
+            core.countChecked(path)
+
+    benchmarks = [
+        Benchmark("getItems", lambda state: Core(usecache=False).getItems(installerdir)),
+        Benchmark("getItems cached", lambda state: Core().getItems(cachedinstallers)),
+        Benchmark("getPresets", lambda state: Core(usecache=False).getPresets(presetdir)),
+        Benchmark("readInfo", lambda state: [readInfo(x, ITEMKEYS) for x in filenames]),
+        Benchmark("readInfo ConfigParser", lambda state: [readConfigParser(x) for x in filenames]),
+        Benchmark("parseItemData", lambda core: core.parseItemData(), unplaced),
+        Benchmark("deps", resolveAll, invalidated),
+        Benchmark("deps memoized", resolveAll, lambda: core.installerItems()),
+        Benchmark("applyPreset", applyAll, cleared),
+        Benchmark("setChecked", checkAll, cleared),
+        Benchmark("setCategoryChecked", checkCategories, cleared),
+    ]
+
+    return benchmarks, cachedir
@@ -0,0 +1,197 @@
+"""Command line front end, for unattended installs: python -m installer
+
+Loads the catalog, applies a preset and any extra includes or excludes,
+pulls in dependencies and installs the result, all without touching Qt."""
+
+import argparse
+import sys
+
+from core import Core, DependencyCycleError
+from execution import InstallGraph, DEFAULT_WORKERS
+from history import formatDuration
+from journal import InstallJournal
+from streaming import StreamingEngine, CallbackSink, LogFileSink
+
+def parseArgs(argv):
+    parser = argparse.ArgumentParser(prog="python -m installer",
+        description="Install a selection of items without the wizard.")
+    parser.add_argument("--installers", default="Installers",
+        help="directory holding the .info files (default: %(default)s)")
+    parser.add_argument("--presets", default="Presets",
+        help="directory holding the .preset files (default: %(default)s)")
+    parser.add_argument("-p", "--preset", help="id of the preset to apply")
+    parser.add_argument("-i", "--include", action="append", default=[],
+        help="id of an extra item to install, may be repeated")
+    parser.add_argument("-x", "--exclude", action="append", default=[],
+        help="id of an item not to install, may be repeated")
+    parser.add_argument("-c", "--category", action="append", default=[],
+        help="install everything under a category path, may be repeated")
+    parser.add_argument("--exclude-category", action="append", default=[],
+        help="install nothing under a category path, may be repeated")
+    parser.add_argument("-n", "--dry-run", action="store_true",
+        help="show what would be installed, and in what order, then stop")
+    parser.add_argument("-l", "--list", action="store_true",
+        help="list the available items and presets, then stop")
+    parser.add_argument("-w", "--workers", type=int, default=DEFAULT_WORKERS,
+        help="items to install at the same time (default: %(default)s)")
+    parser.add_argument("-t", "--timeout", type=float,
+        help="seconds each command may run before it's killed")
+    parser.add_argument("--log", help="append command output to this file")
+    parser.add_argument("--journal", help="journal the run to this file")
+    parser.add_argument("--resume", metavar="JOURNAL",
+        help="carry on with the run journaled in this file")
+    parser.add_argument("--no-cache", action="store_true",
+        help="parse every .info file, ignoring the catalog cache")
+
+    return parser.parse_args(argv)
+
+def listCatalog(core):
+    print "Items:"
+
+    for id, record in sorted(core.installerItems().items()):
+        print "  %-20s %s" % (id, record.name)
+
+    print "Presets:"
+
+    for id, preset in sorted(core.presetItems().items()):
+        print "  %-20s %s" % (id, preset.name)
+
+class ConsoleListener(object):
+    def itemStarted(self, id):
+        print "Installing %s..." % id
+
+    def itemFinished(self, result):
+        if result.cancelled:
+            print "Cancelled %s" % result.id
+        elif result.skipped:
+            print "Skipped %s, as a dependency failed" % result.id
+        elif result.error is not None:
+            print "FAILED %s: %s" % (result.id, result.error)
+        elif result.exitcode:
+            print "FAILED %s, exit code %s" % (result.id, result.exitcode)
+        else:
+            print "Installed %s in %.1fs" % (result.id, result.duration)
+
+def printOutput(id, name, stream, text):
+    print "  [%s/%s] %s" % (id, name, text)
+
+def main(argv=None):
+    args = parseArgs(sys.argv[1:] if argv is None else argv)
+
+    core = Core(usecache=not args.no_cache)
+    core.scanCatalog(args.installers, args.presets)
+    items = core.installerItems()
+
+    if args.list:
+        listCatalog(core)
+        return 0
+
+    state = None
+
+    if args.resume:
+        try:
+            state = core.resume(args.resume)
+        except IOError as e:
+            print >>sys.stderr, "Can't read journal %s: %s" % (args.resume, e.strerror or e)
+            return 2
+    else:
+        if args.preset:
+            if not args.preset in core.presetItems():
+                print >>sys.stderr, "No such preset: %s" % args.preset
+                return 2
+
+            core.applyPreset(args.preset)
+
+        for path in args.category:
+            core.setCategoryChecked(path, True)
+
+        for path in args.exclude_category:
+            core.setCategoryChecked(path, False)
+
+        for id in args.include:
+            items.setChecked(id, True)
+
+        for id in args.exclude:
+            items.setChecked(id, False)
+
+    unknown = [x for x in args.include + args.exclude if not x in items]
+
+    if unknown:
+        print >>sys.stderr, "No such items: %s" % ", ".join(unknown)
+        return 2
+
+    unknown = [x for x in args.category + args.exclude_category if not x in core.categories]
+
+    if unknown:
+        print >>sys.stderr, "No such categories: %s" % ", ".join(unknown)
+        return 2
+
+    try:
+        missing = core.checkDependencies()
+        selected = core.checkedItems()
+        order = InstallGraph(selected).order
+    except DependencyCycleError as e:
+        print >>sys.stderr, "Circular dependencies: %s" % " -> ".join(e.path)
+        return 2
+
+    if missing:
+        print >>sys.stderr, "Missing dependencies: %s" % ", ".join(missing)
+        return 2
+
+    if not selected:
+        print "Nothing to install."
+        return 0
+
+    estimate = core.estimate(workers=args.workers)
+    print "Installing %d items, %s:" % (len(order),
+        formatDuration(estimate) if estimate is not None else "duration unknown")
+
+    for id in order:
+        print "  %s" % id
+
+    if args.dry_run:
+        for id in order:
+            for name, command in selected[id].commands.items():
+                done = state is not None and (id, name) in state.completed
+                print "%s/%s: %s%s" % (id, name, command, " (done)" if done else "")
+
+        return 0
+
+    journal = None
+
+    if args.resume or args.journal:
+        journal = InstallJournal(args.resume or args.journal)
+
+        if args.resume:
+            journal.reopen()
+        else:
+            journal.start(selected)
+
+    sinks = [CallbackSink(printOutput)]
+
+    if args.log:
+        sinks.append(LogFileSink(args.log))
+
+    engine = StreamingEngine(args.workers, sinks=sinks, timeout=args.timeout,
+        listener=ConsoleListener(), history=core.history(), journal=journal)
+
+    try:
+        results = engine.run(selected, state.completed if state is not None else None)
+    except:
+        if journal is not None:
+            journal.close()
+        raise
+
+    failed = [x for x in results.values() if not x.succeeded()]
+
+    if journal is not None:
+        if failed:
+            # Leave the run open, to be resumed
+            journal.close()
+        else:
+            journal.finish()
+
+    return 1 if failed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
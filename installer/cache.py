@@ -0,0 +1,103 @@
+try:
+    # Python 2.x
+    import cPickle as pickle
+except(ImportError):
+    # Python 3.x
+    import pickle
+
+import os
+
+# Returned by CatalogCache.lookup for new or changed files, as None is a valid
+# cached result (a file which isn't an installer).
+MISSING = object()
+
+def fileSignature(stat):
+    # Anything which changes when a file is edited, replaced or swapped out
+    return (stat.st_mtime, stat.st_size, stat.st_ino)
+
+class CatalogCache(object):
+    """Parsed item data for each info file, persisted between runs and keyed
+    by the file's mtime, size and inode so that only new or changed files need
+    parsing again. With no filename the cache is only kept in memory."""
+
+    # Bump whenever the layout of the cached data changes
+    VERSION = 2
+    MAGIC = "pynstaller-catalog"
+
+    def __init__(self, filename):
+        self.filename = filename
+        self.entries = {} # { filename: (signature, data), ... }
+        self.seen = set() # Filenames looked up or stored since loading
+        self.hits = 0
+        self.misses = 0
+        self.dirty = False
+
+    def load(self):
+        # Read the whole cache in one go. Anything unreadable or from another
+        # version is treated as an empty cache.
+        self.entries = {}
+        self.seen = set()
+        self.hits = self.misses = 0
+        self.dirty = False
+
+        if self.filename is None:
+            return False
+
+        try:
+            with open(self.filename, "rb") as f:
+                magic, version, entries = pickle.load(f)
+        except Exception:
+            return False
+
+        if magic != self.MAGIC or version != self.VERSION:
+            return False
+
+        self.entries = entries
+        return True
+
+    def lookup(self, filename, signature):
+        # Return the cached data for a file, or MISSING if it's new or changed
+        self.seen.add(filename)
+        entry = self.entries.get(filename)
+
+        if entry is not None and entry[0] == signature:
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        return MISSING
+
+    def store(self, filename, signature, data):
+        self.seen.add(filename)
+        self.entries[filename] = (signature, data)
+        self.dirty = True
+
+    def save(self):
+        # Drop entries for files which have gone away, then write the cache
+        # back out if anything changed.
+        for filename in list(self.entries):
+            if not filename in self.seen:
+                del self.entries[filename]
+                self.dirty = True
+
+        if not self.dirty or self.filename is None:
+            return False
+
+        tmpname = self.filename + ".tmp"
+
+        try:
+            with open(tmpname, "wb") as f:
+                pickle.dump((self.MAGIC, self.VERSION, self.entries), f,
+                            pickle.HIGHEST_PROTOCOL)
+
+            if os.path.exists(self.filename):
+                # Windows won't rename over an existing file
+                os.remove(self.filename)
+
+            os.rename(tmpname, self.filename)
+        except (IOError, OSError):
+            # Read-only share or similar; the cache is only an optimisation
+            return False
+
+        self.dirty = False
+        return True
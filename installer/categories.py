@@ -0,0 +1,172 @@
+try:
+    # Python 2.x
+    intern
+except(NameError):
+    # Python 3.x
+    from sys import intern
+
+from treeitems import InstallItem
+
+SEPARATOR = "/"
+
+# Where an item with an empty category path is put
+DEFAULTCATEGORY = "Uncategorized"
+
+def splitPath(path):
+    # A category path as a tuple of segments, ignoring stray separators and
+    # space around each, so " Utilities//iDevices/" is Utilities/iDevices.
+    # Segments are interned, as the same few names recur across the catalog.
+    segments = []
+
+    for segment in path.split(SEPARATOR):
+        segment = segment.strip()
+
+        if segment:
+            segments.append(intern(segment) if isinstance(segment, str) else segment)
+
+    return tuple(segments)
+
+class CategoryNode(object):
+    """A category in a CategoryIndex"""
+    __slots__ = ("name", "path", "parent", "children", "item", "_subtree")
+
+    def __init__(self, name=None, path="", parent=None, item=None):
+        self.name = name # Last segment of the path, None for the root
+        self.path = path # Normalized path, which is also the category item's id
+        self.parent = parent # CategoryNode above, None for the root
+        self.children = {} # { segment: CategoryNode, ... }
+        self.item = item # TreeItem showing the category
+        self._subtree = None # frozenset of the ids at or below here, once asked for
+
+    def itemIds(self):
+        # Every item id at or below this category, worked out from the
+        # placements when first asked for, and kept until they change
+        if self._subtree is None:
+            ids = set(x.id for x in self.item.childItems if isinstance(x, InstallItem))
+            ids.update(x.id for x in self.item.pendingItems if isinstance(x, InstallItem))
+
+            for child in self.children.values():
+                ids.update(child.itemIds())
+
+            self._subtree = frozenset(ids)
+
+        return self._subtree
+
+    def invalidate(self):
+        # The ids at or below this category have changed
+        node = self
+
+        while node is not None:
+            node._subtree = None
+            node = node.parent
+
+class CategoryIndex(object):
+    """Trie of the categories in the tree, by normalized path. Finding a
+    category costs the depth of its path, and the items anywhere under a
+    category are found without walking the rest of the tree. They're kept
+    by each category once found, until an item's placed or removed below."""
+
+    def __init__(self, root=None):
+        self.root = CategoryNode(item=root)
+        self._count = 0 # Categories, not counting the root
+
+    def __len__(self):
+        return self._count
+
+    def __contains__(self, path):
+        node = self.find(path)
+        return node is not None and node is not self.root
+
+    def __getitem__(self, path):
+        # The TreeItem of the category at path
+        node = self.find(path)
+
+        if node is None or node is self.root:
+            raise(KeyError(path))
+
+        return node.item
+
+    def __delitem__(self, path):
+        self.remove(path)
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def keys(self):
+        # Path of every category, parents before their children
+        paths = []
+        pending = [self.root]
+
+        while pending:
+            node = pending.pop()
+
+            if node is not self.root:
+                paths.append(node.path)
+
+            pending.extend(node.children.values())
+
+        return paths
+
+    def find(self, path):
+        # The CategoryNode at path, or None. An empty path is the root.
+        node = self.root
+
+        for segment in splitPath(path):
+            node = node.children.get(segment)
+
+            if node is None:
+                return None
+
+        return node
+
+    def insert(self, path, create):
+        # The CategoryNode at path, making any categories missing along the
+        # way. create(parent item, name, path) makes the TreeItem for a new
+        # category and puts it in the tree.
+        node = self.root
+
+        for segment in splitPath(path) or (DEFAULTCATEGORY,):
+            child = node.children.get(segment)
+
+            if child is None:
+                key = node.path + SEPARATOR + segment if node.path else segment
+                child = CategoryNode(segment, key, node)
+                child.item = create(node.item, segment, key)
+                node.children[segment] = child
+                self._count += 1
+
+            node = child
+
+        return node
+
+    def remove(self, path):
+        # Take a category, and everything below it, out of the index
+        node = self.find(path)
+
+        if node is None or node is self.root:
+            raise(KeyError(path))
+
+        node.parent.invalidate()
+        del node.parent.children[node.name]
+        pending = [node]
+
+        while pending:
+            node = pending.pop()
+            pending.extend(node.children.values())
+            self._count -= 1
+
+    def itemsChanged(self, path):
+        # An item's been placed in or removed from the category at path
+        node = self.find(path)
+
+        if node is not None:
+            node.invalidate()
+
+    def itemIds(self, path=""):
+        # Every item id anywhere under path, all of them for the root
+        node = self.find(path)
+
+        if node is None:
+            return frozenset()
+
+        return node.itemIds()
@@ -1,49 +1,251 @@
-try:
-    # Python 2.x
-    import ConfigParser
-except(ImportError):
-    # Python 3.x
-    import configparser as ConfigParser
-
 import os
 import collections
 
-from treeitems import TreeItem, InstallItem, PresetItem
+from treeitems import TreeItem, InstallItem, PresetItem, ItemData
+from discovery import CatalogScanner, DEFAULT_WORKERS
+from cache import CatalogCache, MISSING, fileSignature
+from selection import SelectionState
+from categories import CategoryIndex
+from history import RunHistory
+from journal import InstallJournal
+from startup import report
+from texts import itemTexts, fieldsChecksum
+from infoparser import readInfo, ITEMKEYS, PRESETKEYS
+
+# Children handed to the view at a time, by a lazy Core
+FETCH_CHUNK = 256
+
+class DependencyCycleError(RuntimeError):
+    """Raised when items depend on each other in a loop"""
+    def __init__(self, path):
+        RuntimeError.__init__(self, "Dependency cycle: %s" % " -> ".join(path))
+        self.path = path # [id, ..., id], starting and ending on the same id
 
 class InstallerDict(dict):
+    def __init__(self, *args, **kwargs):
+        super(InstallerDict, self).__init__()
+        self._depcache = {} # { id: frozenset of transitive deps, ... }
+        self._rdeps = {} # { id: set of ids directly depending on it, ... }
+        self._rdepcache = {} # { id: frozenset of transitive dependents, ... }
+        self._checkboxmask = None # Selection mask of checkbox items
+        self.selection = SelectionState() # Checked state of every id
+        self.update(*args, **kwargs)
+        
+    def __setitem__(self, id, value):
+        if id in self:
+            self._unindex(id)
+            
+        super(InstallerDict, self).__setitem__(id, value)
+        self._index(id)
+        value.selection = self.selection
+        
+    def __delitem__(self, id):
+        self._unindex(id)
+        super(InstallerDict, self).__delitem__(id)
+        
+    def pop(self, id, *args):
+        if id in self:
+            self._unindex(id)
+            
+        return super(InstallerDict, self).pop(id, *args)
+    
+    def update(self, *args, **kwargs):
+        for id, value in dict(*args, **kwargs).items():
+            self[id] = value
+    
+    def clear(self):
+        super(InstallerDict, self).clear()
+        self._rdeps.clear()
+        self.invalidate()
+        
+    def invalidate(self):
+        # Forget everything worked out from the catalog's contents
+        self._depcache.clear()
+        self._rdepcache.clear()
+        self._checkboxmask = None
+        
+    def _index(self, id):
+        # Record this item in the reverse index of each of its dependencies,
+        # which may not be in the catalog (yet).
+        for dep in self._directDeps(id):
+            self._rdeps.setdefault(dep, set()).add(id)
+            
+        self.invalidate()
+        
+    def _unindex(self, id):
+        for dep in self._directDeps(id):
+            dependents = self._rdeps.get(dep)
+            
+            if dependents is not None:
+                dependents.discard(id)
+                
+                if not dependents:
+                    del self._rdeps[dep]
+                    
+        self.invalidate()
+        
     def setChecked(self, id, value):
-        for item in self.get(id):
-            item.setChecked(value)
+        record = self.get(id)
+        
+        if record is None or not record.checkType or self.selection.isSet(id) == bool(value):
+            return
+        
+        if record.checkType == TreeItem.RADIOBUTTONITEM:
+            if not value:
+                # Radiobuttons are only unchecked by checking another
+                return
+            
+            with self.selection.batch():
+                # Placements share their state, but not their radiogroups
+                for item in record.placements:
+                    if item.parentItem is not None:
+                        item.parentItem.clearRadioSelections(item)
+                        
+                self.selection.set(id, True)
+        else:
+            self.selection.set(id, value)
         
     def isChecked(self, id):
-        return self.get(id)[0].isChecked()
+        return self.selection.isSet(id)
+    
+    def checkedIds(self):
+        return [x for x in self.selection.checkedIds() if x in self]
+    
+    def setAllChecked(self, value, ids=None):
+        # Bulk (un)check every checkbox item, or only those among ids.
+        # Radiobuttons are left alone, as they can't all be checked at once.
+        self.selection.setAll(value, self._checkboxMask(ids))
+        
+    def invertChecked(self):
+        self.selection.invert(self._checkboxMask())
+        
+    def countChecked(self, ids=None):
+        # How many items are checked, or how many of ids
+        if ids is None:
+            return len(self.checkedIds())
+        
+        return self.selection.count(self.selection.mask(x for x in ids if x in self))
+        
+    def _checkboxMask(self, ids=None):
+        if ids is not None:
+            return self.selection.mask(x for x in ids
+                if x in self and self[x].checkType == TreeItem.CHECKBOXITEM)
+        
+        if self._checkboxmask is None:
+            self._checkboxmask = self.selection.mask(id for id, record in self.items()
+                if record.checkType == TreeItem.CHECKBOXITEM)
+            
+        return self._checkboxmask
     
     def deps(self, id):
-        def getMoreDeps(id, prevdeps=None):
-            deps = self.get(id)[0].depends
+        # Every id this item needs, directly or not. Ids missing from the
+        # catalog are included, but have no dependencies of their own.
+        closure = self._depcache.get(id)
+        
+        if closure is None:
+            closure = self._resolveDeps(id)
+            
+        return closure
+    
+    def _resolveDeps(self, id):
+        # Iterative depth first walk, memoizing the closure of every item it
+        # finishes so that shared sub-dependencies are only walked once.
+        cache = self._depcache
+        path = [id] # Items being walked, for reporting cycles
+        onpath = set(path)
+        stack = [(id, iter(self._directDeps(id)))]
+        
+        while stack:
+            current, remaining = stack[-1]
             
-            if prevdeps is None:
-                prevdeps = set()
+            for dep in remaining:
+                if dep in onpath:
+                    cycle = path[path.index(dep):] + [dep]
+                    raise(DependencyCycleError(cycle))
+                
+                if not dep in cache:
+                    path.append(dep)
+                    onpath.add(dep)
+                    stack.append((dep, iter(self._directDeps(dep))))
+                    break
+            else:
+                # All of current's dependencies are resolved
+                closure = set()
                 
-            for dep in deps:
-                prevdeps.add(dep)
-                getMoreDeps(dep, prevdeps)
+                for dep in self._directDeps(current):
+                    closure.add(dep)
+                    closure.update(cache[dep])
+                    
+                cache[current] = frozenset(closure)
+                stack.pop()
+                onpath.discard(path.pop())
+                
+        return cache[id]
+    
+    def dependents(self, id, transitive=True):
+        # Every id needing this item, directly or (by default) not
+        if not transitive:
+            return frozenset(self._rdeps.get(id, ()))
+        
+        closure = self._rdepcache.get(id)
+        
+        if closure is None:
+            closure = set()
+            pending = [id]
+            
+            while pending:
+                for dependent in self._rdeps.get(pending.pop(), ()):
+                    if not dependent in closure:
+                        closure.add(dependent)
+                        pending.append(dependent)
+                        
+            closure.discard(id)
+            closure = self._rdepcache[id] = frozenset(closure)
             
-            return prevdeps
+        return closure
+    
+    def _directDeps(self, id):
+        record = self.get(id)
+        
+        if record is None:
+            return []
         
-        return getMoreDeps(id)
+        return record.depends
 
 class PresetDict(dict):
     pass
 
+class CatalogChanges(object):
+    """Item ids affected by a Core.refresh"""
+    def __init__(self, added=None, removed=None, modified=None):
+        self.added = added or []
+        self.removed = removed or []
+        self.modified = modified or []
+
+    def __nonzero__(self):
+        return bool(self.added or self.removed or self.modified)
+
+    __bool__ = __nonzero__
+
+    def __repr__(self):
+        return "<CatalogChanges added=%r removed=%r modified=%r>" % \
+            (self.added, self.removed, self.modified)
+
 class Core(object):
-    def __init__(self, installerfileext=".info", presetfileext=".preset"):
+    def __init__(self, installerfileext=".info", presetfileext=".preset", usecache=True, lazy=False):
         self._treeitems = InstallerDict() # Simple dict of all items found
         self._presetitems = PresetDict()
         self._itemroot = TreeItem(None) # Heirarchy of items, in their respective categories
-        self.categories = {} # Categories available
+        self.categories = CategoryIndex(self._itemroot) # Categories available, by path
         self.installerfileext = installerfileext # File extension for info files
         self.presetfileext = presetfileext # File extension for info files
+        self.scanstats = None # ScanStats of the last directory scan
+        self.usecache = usecache # Keep parsed info files in a CatalogCache
+        self.cache = None # CatalogCache used by the last scan
+        self._files = {} # { filename: data, ... } for each loaded info file
+        self.treelistener = None # Told about rows added or removed by refresh()
+        self._history = None # RunHistory, opened on first use
+        self.lazy = lazy # Only put categories' children in the tree once asked
     
     def installerItems(self):
         return self._treeitems
@@ -51,43 +253,322 @@ class Core(object):
     def rootItem(self):
         return self._itemroot
     
+    def checkedItems(self):
+        # { id: item, ... } of everything to be installed, one copy of each
+        return dict((id, self._treeitems[id]) for id in self._treeitems.checkedIds())
+    
+    def resume(self, journal):
+        # Pick up an install run interrupted part way through, e.g. by a
+        # reboot. The selection is put back as it was, and the returned
+        # JournalState's completed commands can be skipped by the engine.
+        state = InstallJournal.read(journal)
+        
+        with self._treeitems.selection.batch():
+            self._treeitems.selection.setAll(False)
+            self._treeitems.selection.setMany([x for x in state.ids if x in self._treeitems], True)
+        
+        return state
+    
+    def history(self):
+        # How long commands took before, kept next to the installers directory
+        if self._history is None:
+            directory = os.path.abspath(self.installerdir)
+            filename = "%s.history" % os.path.basename(directory)
+            self._history = RunHistory(os.path.join(os.path.dirname(directory), filename))
+            
+        return self._history
+    
+    def estimate(self, ids=None, workers=None, percentile=None):
+        # Expected seconds to install the given ids, or everything checked, or
+        # None if nothing has ever been installed to base a guess on, or the
+        # items depend on each other in a circle and can't be ordered. With a
+        # percentile (0-100), e.g. 90, a pessimistic rather than mean guess.
+        from execution import InstallEngine, DEFAULT_WORKERS # Imports Core
+        
+        if ids is None:
+            items = self.checkedItems()
+        else:
+            items = dict((id, self._treeitems[id]) for id in ids if id in self._treeitems)
+            
+        if self.history().typical() is None:
+            return None
+        
+        engine = InstallEngine(workers or DEFAULT_WORKERS, history=self.history())
+        
+        try:
+            return engine.predict(items, percentile)
+        except DependencyCycleError:
+            return None
+    
+    def setTreeListener(self, listener):
+        # The listener is told about every child added to or removed from the
+        # tree after the initial load, through these methods:
+        #   childrenAboutToBeInserted(parent, first, last), childrenInserted()
+        #   childrenAboutToBeRemoved(parent, first, last), childrenRemoved()
+        # and about ids whose checked state changed, through
+        #   selectionChanged(ids)
+        self.treelistener = listener
+        self._treeitems.selection.listener = listener
+        
+    def attachChild(self, parent, child):
+        if not parent.loaded or parent.pendingItems:
+            # Nobody's asked for the parent's children yet, or not all of them
+            parent.deferChild(child)
+            return
+            
+        row = parent.childCount()
+        
+        if self.treelistener is not None:
+            self.treelistener.childrenAboutToBeInserted(parent, row, row)
+            
+        parent.appendChild(child)
+        child.parentItem = parent
+        
+        if self.treelistener is not None:
+            self.treelistener.childrenInserted()
+            
+    def detachChild(self, parent, child):
+        row = child.row()
+        
+        if row < 0:
+            # Never made it into the tree
+            parent.removeChild(child)
+            return
+            
+        if self.treelistener is not None:
+            self.treelistener.childrenAboutToBeRemoved(parent, row, row)
+            
+        parent.removeChild(child)
+        
+        if self.treelistener is not None:
+            self.treelistener.childrenRemoved()
+    
+    def canFetchChildren(self, parent):
+        return bool(parent.pendingItems)
+        
+    def fetchChildren(self, parent, count=FETCH_CHUNK):
+        # Put the next count of a category's children into the tree
+        count = min(count, len(parent.pendingItems))
+        
+        if not count:
+            parent.loaded = True
+            return 0
+            
+        row = parent.childCount()
+        
+        if self.treelistener is not None:
+            self.treelistener.childrenAboutToBeInserted(parent, row, row + count - 1)
+            
+        parent.fetchChildren(count)
+        
+        if self.treelistener is not None:
+            self.treelistener.childrenInserted()
+            
+        return count
+        
     def cleanUpItems(self):
         # Delete everything, so we can start from scratch
         del self._itemroot
         for item in self._treeitems:
             del item
             
-        for item in self.categories:
-            del item
-            
         self._treeitems = InstallerDict()
+        self._treeitems.selection.listener = self.treelistener
         self._itemroot = TreeItem(None)
-        self.categories = {}
+        self.categories = CategoryIndex(self._itemroot)
+        self._files = {}
     
-    def getItems(self, searchdir):
-        # Gather filenames matching a specific extension, for later processing
+    def openCache(self, installerdir):
+        # The cache lives next to the installers directory, named after it.
+        # Without it, parsed data is still kept in memory for refresh().
+        if not self.usecache:
+            return CatalogCache(None)
+
+        directory = os.path.abspath(installerdir)
+        filename = "%s.cache" % os.path.basename(directory)
+        cache = CatalogCache(os.path.join(os.path.dirname(directory), filename))
+
+        with report.phase("load cache", "core"):
+            cache.load()
+
+        return cache
+
+    def getItems(self, searchdir, workers=DEFAULT_WORKERS):
+        # Gather and parse every file matching a specific extension
+        with report.phase("Core.getItems", "core"):
+            self.cleanUpItems()
+            self.installerdir = searchdir
+            self.cache = self.openCache(searchdir)
+
+            scanner = CatalogScanner(workers)
+            root = scanner.addRoot(searchdir, self.installerfileext, self.readItemFile, self.cache)
+            self.runScanner(scanner)
+            self.addItemResults(root.results)
+
+    def scanCatalog(self, installerdir, presetdir, workers=DEFAULT_WORKERS):
+        # Gather installers and presets together, walking both directories in
+        # a single pass.
         self.cleanUpItems()
-        self.installerdir = searchdir
-        directory = os.path.abspath(self.installerdir)
-        candidates = []
+        self.installerdir = installerdir
+        self.presetdir = presetdir
+        with report.phase("Core.scanCatalog", "core"):
+            self.cache = self.openCache(installerdir)
+
+            scanner = CatalogScanner(workers)
+            items = scanner.addRoot(installerdir, self.installerfileext, self.readItemFile, self.cache)
+            presets = scanner.addRoot(presetdir, self.presetfileext, self.readPresetFile)
+            self.runScanner(scanner)
+            self.addItemResults(items.results)
+            self.addPresetResults(presets.results)
+
+        return scanner.stats
+
+    def runScanner(self, scanner):
+        with report.phase("walk and parse", "core") as args:
+            scanner.run()
+            args.update(directories=scanner.stats.directories, found=scanner.stats.found,
+                        parsed=scanner.stats.parsed, cached=scanner.stats.cached)
+
+        self.scanstats = scanner.stats
+
+        with report.phase("save cache", "core"):
+            self.cache.save()
+
+    def addItemResults(self, results):
+        with report.phase("Core.addItemData", "core", items=len(results)):
+            for filename, dir, data in results:
+                self._files[filename] = data
+                self.addItemData(data)
+
+        with report.phase("Core.parseItemData", "core"):
+            self.parseItemData()
+
+    def refresh(self, filenames=None, workers=DEFAULT_WORKERS):
+        # Bring the loaded items up to date with the installers directory,
+        # without tearing everything down like getItems does. Only new or
+        # changed files are parsed; if filenames is given, only those files
+        # are looked at instead of walking the whole directory.
+        if self.cache is None:
+            self.cache = self.openCache(self.installerdir)
+            
+        if filenames is None:
+            scanner = CatalogScanner(workers)
+            root = scanner.addRoot(self.installerdir, self.installerfileext, self.readItemFile, self.cache)
+            scanner.run()
+            self.scanstats = scanner.stats
+            
+            current = dict((filename, data) for filename, dir, data in root.results)
+        else:
+            current = dict(self._files)
+            
+            for filename in self.expandPaths(filenames):
+                data = self.readChangedFile(filename)
+                
+                if data is None:
+                    current.pop(filename, None)
+                else:
+                    current[filename] = data
+            
+            # Untouched files are still current, keep them in the cache
+            self.cache.seen.update(current)
+        
+        self.cache.save()
+        
+        return self.applyFiles(current)
+    
+    def expandPaths(self, paths):
+        # Turn a list of touched paths into the info files they affect. A
+        # directory stands for every file loaded from, or now found in, it.
+        filenames = set()
         
-        for dir in os.walk(directory):
-            # Find each and every file with desired extension
+        for path in paths:
+            path = os.path.abspath(path)
             
-            curdir = dir[0]
-            # dirs = dir[1]
-            files = dir[2]
+            if path.endswith(self.installerfileext) and not os.path.isdir(path):
+                filenames.add(path)
+                continue
             
-            for file in files:
-                if file.endswith(self.installerfileext):
-                    filename = os.path.abspath(os.path.join(curdir, file))
-                    candidates.append((filename, curdir))
+            prefix = path + os.sep
+            filenames.update(x for x in self._files if x.startswith(prefix))
+            
+            for dir, dirs, files in os.walk(path):
+                filenames.update(os.path.join(dir, x) for x in files
+                                 if x.endswith(self.installerfileext))
+        
+        return sorted(filenames)
+    
+    def readChangedFile(self, filename):
+        # Parse a single info file, unless the cache says it hasn't changed
+        try:
+            signature = fileSignature(os.stat(filename))
+        except OSError:
+            # Deleted
+            return None
+        
+        data = self.cache.lookup(filename, signature)
         
-        for item, dir in candidates:
-            self.gatherItemData(item, dir)
+        if data is MISSING:
+            data = self.readItemFile(filename, os.path.dirname(filename))
+            self.cache.store(filename, signature, data)
             
-        self.parseItemData()
+        return data
     
+    def applyFiles(self, current):
+        # Work out which item ids the difference between the loaded files and
+        # the current ones amounts to, and patch the catalog to match.
+        def groupById(files):
+            groups = {}
+            
+            for filename in sorted(files):
+                data = files[filename]
+                groups.setdefault(data["id"], []).append(data)
+                
+            return groups
+        
+        old = groupById(self._files)
+        new = groupById(current)
+        
+        changes = CatalogChanges(
+            added=sorted(x for x in new if not x in old),
+            removed=sorted(x for x in old if not x in new),
+            modified=sorted(x for x in new if x in old and new[x] != old[x]))
+        
+        for id in changes.removed + changes.modified:
+            self.removeItem(id)
+            
+        for id in changes.added + changes.modified:
+            for data in new[id]:
+                self.addItemData(data)
+            
+            self.placeItems(self._treeitems[id])
+        
+        # Edited items keep whatever state the user gave them, as it's held by
+        # id in the selection. Removed ones are cleared.
+        self._treeitems.selection.setMany(changes.removed, False)
+            
+        self._files = current
+        
+        return changes
+    
+    def removeItem(self, id):
+        # Take every copy of an item out of the catalog and its categories
+        record = self._treeitems.pop(id)
+        itemTexts.forget(record.source)
+        
+        for item in record.placements:
+            parent = item.parentItem
+            self.detachChild(parent, item)
+            self.categories.itemsChanged(parent.id)
+            self.pruneCategory(parent)
+    
+    def pruneCategory(self, cat):
+        # Remove a category, and any parents, left without children
+        while cat is not self._itemroot and not cat.childCount() and not cat.pendingItems:
+            parent = cat.parentItem
+            self.detachChild(parent, cat)
+            del self.categories[cat.id]
+            cat = parent
+
     def getOption(self, parser, section, option, rtn=None):
         # Allow getting an option, providing a default if it doesn't exist
         if parser.has_section(section):
@@ -99,31 +580,41 @@ class Core(object):
     def gatherItemData(self, item, dir):
         # Actively process data from the gathered filenames, creating items
         # where needed
-        parser = ConfigParser.SafeConfigParser()
-        
+        data = self.readItemFile(item, dir)
+
+        if data is not None:
+            self._files[os.path.abspath(item)] = data
+            self.addItemData(data)
+
+    def readItemFile(self, item, dir):
+        # Parse a single info file into a dict of item data. Called from the
+        # scanner's worker threads, so it mustn't touch any shared state.
         try:
-            parser.read(item)
+            parser = readInfo(item, ITEMKEYS)
     
         except:
             # Not a parsable file.
-            return
+            return None
         
         # Make sure the item has the very least needed to be displayed
         if not parser.has_section("Core"):
-            return
+            return None
         
         if not parser.has_option("Core","name"):
-            return
+            return None
         
         if not parser.has_option("Core","id"):
-            return
+            return None
         
         # Cache the data for the item
         itemname = self.getOption(parser, "Core", "name", "Unnamed item")
         itemsummary = self.getOption(parser, "Core", "summary")
         itemid = self.getOption(parser, "Core", "id")
-        itemtooltip = self.getOption(parser, "Core", "tooltip")
-        itemhelptext = self.getOption(parser, "Core", "helptext", "<i>No information is available for this item</i>")
+        # The tooltip and help text are read again when they're shown, so
+        # only a fingerprint is kept, to notice when they're edited
+        texts = fieldsChecksum({
+            "tooltip": self.getOption(parser, "Core", "tooltip"),
+            "helptext": self.getOption(parser, "Core", "helptext")})
         itemchecktype = int(self.getOption(parser, "Core", "checktype", TreeItem.CHECKBOXITEM))
         itemcommands = collections.OrderedDict()
         itemdepends = self.getOption(parser, "Core", "depends", [])
@@ -133,122 +624,124 @@ class Core(object):
         else:
             itemdepends = [x.strip() for x in itemdepends]
             
-        for name, cmd in parser.items("Commands"):
-            if not name in itemcommands:
-                itemcommands[name] = cmd
-            else:
-                raise(RuntimeError("Command %s for item with id %s already exists" % (name, itemid)))
+        if parser.has_section("Commands"):
+            for name, cmd in parser.items("Commands"):
+                if not name in itemcommands:
+                    itemcommands[name] = cmd
+                else:
+                    raise(RuntimeError("Command %s for item with id %s already exists" % (name, itemid)))
         
+        cats = [x.strip() for x in self.getOption(parser, "Core", "categories", "Uncategorized").split(",")]
+
+        return {
+            "id": itemid,
+            "name": itemname,
+            "summary": itemsummary,
+            "file": item,
+            "texts": texts,
+            "checktype": itemchecktype,
+            "commands": itemcommands,
+            "depends": itemdepends,
+            "categories": cats,
+            "cwd": dir,
+        }
+
+    def addItemData(self, data):
         # Provide the ability to have items seem to inhabit multiple categories.
         # Due to how the treeview works, probably the only way to achieve this
-        # is to create a copy of the item per category entry.
-        cats = [x.strip() for x in self.getOption(parser, "Core", "categories", "Uncategorized").split(",")]
+        # is a node per category entry. The nodes are only placements; the
+        # item itself is one record, which everything else works with. If
+        # another file has the same id, its categories are added to the
+        # first one's record.
+        record = self._treeitems.get(data["id"])
+        
+        if record is None:
+            record = ItemData(data["id"], data["file"])
+            record.name = data["name"]
+            record.summary = data["summary"]
+            record.cwd = data["cwd"]
+            record.commands = data["commands"]
+            record.checkType = data["checktype"]
+            record.depends = data["depends"]
+            self._treeitems[record.id] = record
         
-        for cat in cats:
-            item = InstallItem(itemid)
-            item.name = itemname
-            item.summary = itemsummary
+        for cat in data["categories"]:
+            item = InstallItem(record.id, record)
             item.category = cat
-            item.tooltip = itemtooltip
-            item.helptext = itemhelptext
-            item.cwd = dir
-            item.commands = itemcommands
-            item.checkType = itemchecktype
-            item.depends = itemdepends
-
-            if not item.id in self._treeitems:
-                self._treeitems[item.id] = [item,]
-            else:
-                self._treeitems[item.id].append(item)
+            record.addPlacement(item)
 
     def parseItemData(self):
-        # Make the categories that will be displayed. Allows for nested cats
-        
-        def makeCats(cats, curcat, curpath="/"):
-            # Recursively parse a category path, creating category items as 
-            # needed
-            
-            if not cats:
-                # No more categories to walk
-                return curcat
+        # Parse each item, grab its category path, parse the path
+        for record in self._treeitems.values():
+            self.placeItems(record)
             
-            catname = cats.pop(0)
-            curpath = "%s/%s" % (curpath, catname)
+    def makeCat(self, parent, name, path):
+        # Make a category that will be displayed, under parent. Called by
+        # the category index for each part of a path not seen before.
+        cat = TreeItem(path)
+        cat.name = name
+        cat.cwd = path
+        cat.loaded = not self.lazy
+        
+        self.attachChild(parent, cat)
+        return cat
+    
+    def placeItems(self, record):
+        # Put each of an item's placements into its category
+        for item in record.placements:
+            node = self.categories.insert(item.category, self.makeCat)
+            self.attachChild(node.item, item)
+            node.invalidate()
             
-            if not curpath in self.categories:
-                # Make the current path exist, and allow for it to be used 
-                # later as well
-                
-                cat = TreeItem(curpath)
-                cat.name = catname
-                cat.cwd = curpath
+            # Add item to its parents radiogroup if it's a radiobutton item
+            if item.checkType == item.RADIOBUTTONITEM:
+                item.parentItem.addRadioItem(item)
                 
-                self.categories[curpath] = cat
-                curcat.appendChild(cat)
-                cat.parentItem = curcat
-            else:
-                # Use pre-existing path
-                cat = self.categories[curpath]
-                
-            return makeCats(cats, cat, curpath)
+    def getPresets(self, searchdir, workers=DEFAULT_WORKERS):
+        with report.phase("Core.getPresets", "core"):
+            self.presetdir = searchdir
 
-        # Parse each item, grab its category path, parse the path
-        for itemgroup in self._treeitems.values():
-            for item in itemgroup:
-                cats = item.category.split("/")
-                curcat = makeCats(cats, self._itemroot)
-                item.parentItem = curcat
-                curcat.appendChild(item)
-                
-                # Add item to its parents radiogroup if it's a radiobutton item
-                if item.checkType == item.RADIOBUTTONITEM:
-                    item.parentItem.radioGroup.append(item)
-                    
-                for dep in itemgroup[0].depends:
-                        for x in self._treeitems[dep]:
-                            x.dependedby.append(item.id)
-    
-    def getPresets(self, searchdir):
-        self.presetdir = searchdir
-        directory = os.path.abspath(self.presetdir)
-        candidates = []
-        
-        for dir in os.walk(directory):
-            # Find each and every file with desired extension
-            
-            curdir = dir[0]
-            # dirs = dir[1]
-            files = dir[2]
-            
-            for file in files:
-                if file.endswith(self.presetfileext):
-                    filename = os.path.abspath(os.path.join(curdir, file))
-                    candidates.append((filename, curdir))
-        
-        for item, dir in candidates:
-            self.gatherPresetData(item, dir)
+            scanner = CatalogScanner(workers)
+            root = scanner.addRoot(searchdir, self.presetfileext, self.readPresetFile)
+
+            with report.phase("walk and parse", "core"):
+                scanner.run()
+
+            self.scanstats = scanner.stats
+            self.addPresetResults(root.results)
+
+    def addPresetResults(self, results):
+        with report.phase("Core.addPresetData", "core", presets=len(results)):
+            for filename, dir, preset in results:
+                self.addPresetData(preset)
         
     def gatherPresetData(self, item, dir):
         # Actively process data from the gathered filenames, creating items
         # where needed
-        parser = ConfigParser.SafeConfigParser()
-        
+        preset = self.readPresetFile(item, dir)
+
+        if preset is not None:
+            self.addPresetData(preset)
+
+    def readPresetFile(self, item, dir):
+        # Parse a single preset file. Like readItemFile, this runs on the
+        # scanner's worker threads.
         try:
-            parser.read(item)
+            parser = readInfo(item, PRESETKEYS)
     
         except:
             # Not a parsable file.
-            return
+            return None
         
         # Make sure the item has the very least needed to be displayed
         if not parser.has_section("Core"):
-            return
+            return None
         
         if not parser.has_option("Core","name"):
-            return
+            return None
         
         if not parser.has_option("Core","id"):
-            return
+            return None
         
         preset = PresetItem(self.getOption(parser, "Core", "id"))
         preset.name = self.getOption(parser, "Core", "name")
@@ -269,7 +762,10 @@ class Core(object):
                 preset.excludes = [x.strip() for x in preset.excludes.split(",")]
             else:
                 preset.excludes = [x.strip() for x in preset.excludes]
-            
+
+        return preset
+
+    def addPresetData(self, preset):
         if not preset.id in self._presetitems:
             self._presetitems[preset.id] = preset
         else:
@@ -277,14 +773,53 @@ class Core(object):
         
     def presetItems(self):
         return self._presetitems
+    
+    def applyPreset(self, presetid):
+        preset = self._presetitems[presetid]
+        
+        # Changes are reported once, when the whole preset's applied
+        with self._treeitems.selection.batch():
+            for x in preset.includes:
+                self._treeitems.setChecked(x, True)
+                
+            for x in preset.excludes:
+                self._treeitems.setChecked(x, False)
+                
+    def categoryItems(self, path):
+        # Ids of every item anywhere under a category, e.g. "Utilities/"
+        return self.categories.itemIds(path)
+        
+    def setCategoryChecked(self, path, value):
+        # (Un)check every checkbox item under a category, in one go
+        self._treeitems.setAllChecked(value, self.categories.itemIds(path))
+        
+    def countChecked(self, path=None):
+        # How many items are checked, or how many under a category
+        if path is None:
+            return self._treeitems.countChecked()
+        
+        return self._treeitems.countChecked(self.categories.itemIds(path))
+            
+    def checkDependencies(self):
+        # Check everything the checked items need, returning the ids of any
+        # dependencies which aren't in the catalog.
+        missing = set()
+        
+        for id in self._treeitems.checkedIds():
+            for dep in self._treeitems.deps(id):
+                if dep in self._treeitems:
+                    self._treeitems.setChecked(dep, True)
+                else:
+                    missing.add(dep)
+                    
+        return sorted(missing)
         
 if __name__ == "__main__":
     c = Core()
     c.getItems("..\Installers")
     c.getPresets("..\Presets")
     
-    for key, itemgroup in c.installerItems().iteritems():
-        #print key, "depends on", itemgroup[0].depends, "and is depended on by", itemgroup[0].dependedby
+    for key, record in c.installerItems().iteritems():
         print key, "depends on", c.installerItems().deps(key)
         
     for key, preset in c.presetItems().iteritems():
@@ -0,0 +1,201 @@
+try:
+    # Python 2.x
+    import Queue as queue
+except(ImportError):
+    # Python 3.x
+    import queue
+
+try:
+    # Python 3.5+
+    from os import scandir
+except(ImportError):
+    try:
+        # Python 2.x, with the scandir backport installed
+        from scandir import scandir
+    except(ImportError):
+        scandir = None
+
+import os
+import threading
+from timeit import default_timer as clock
+
+from cache import MISSING, fileSignature
+
+DEFAULT_WORKERS = 8
+
+def iterDirectory(path):
+    # Yield (name, fullpath, isdir, stat) for each entry of a directory, where
+    # stat is a callable returning the entry's os.stat result. scandir gets
+    # the entry type from the directory listing itself, saving a stat call per
+    # entry on filesystems which report it (most of them). As with os.walk,
+    # symlinks to directories aren't followed, nor given as files.
+    if scandir is not None:
+        for entry in scandir(path):
+            try:
+                isdir = entry.is_dir(follow_symlinks=False)
+
+                if not isdir and entry.is_symlink() and entry.is_dir():
+                    continue
+            except OSError:
+                continue
+            yield entry.name, entry.path, isdir, entry.stat
+    else:
+        for name in os.listdir(path):
+            fullpath = os.path.join(path, name)
+            isdir = os.path.isdir(fullpath)
+
+            if isdir and os.path.islink(fullpath):
+                continue
+            yield name, fullpath, isdir, \
+                lambda fullpath=fullpath: os.stat(fullpath)
+
+class ScanRoot(object):
+    """A directory to be searched for files with a given extension"""
+    def __init__(self, directory, extension, parse, cache=None):
+        self.directory = os.path.abspath(directory)
+        self.extension = extension
+        self.parse = parse # Callable taking (filename, dir), returning data
+        self.cache = cache # Optional CatalogCache of previously parsed data
+        self.results = [] # [(filename, dir, data), ...], in walk order
+        self.found = 0 # Files matching the extension
+
+class ScanStats(object):
+    """Counters and timings of a single CatalogScanner run"""
+    def __init__(self):
+        self.directories = 0 # Directories listed
+        self.found = 0 # Files matching any root's extension
+        self.parsed = 0 # Files with usable data, parsed or cached
+        self.cached = 0 # Files whose data came from a CatalogCache
+        self.elapsed = 0.0 # Seconds, for the whole run
+        self.walktime = 0.0 # Seconds spent listing directories
+
+    def __repr__(self):
+        return "<ScanStats %d dirs, %d found, %d parsed, %d cached, %.1fms>" % \
+            (self.directories, self.found, self.parsed, self.cached,
+             self.elapsed * 1000)
+
+class CatalogScanner(object):
+    """Walks any number of directory roots in a single pass, handing matching
+    files to a bounded pool of parser threads while the walk continues."""
+
+    def __init__(self, workers=DEFAULT_WORKERS):
+        self.workers = max(1, workers)
+        self.roots = []
+        self.stats = ScanStats()
+
+    def addRoot(self, directory, extension, parse, cache=None):
+        root = ScanRoot(directory, extension, parse, cache)
+        self.roots.append(root)
+        return root
+
+    def run(self):
+        self.stats = ScanStats()
+        start = clock()
+
+        # Bound the queue, so a slow parse stalls the walk instead of piling up
+        # an unbounded backlog of work.
+        tasks = queue.Queue(self.workers * 4)
+        errors = []
+
+        def worker():
+            while True:
+                task = tasks.get()
+
+                if task is None:
+                    return
+
+                root, index, filename, dir, signature = task
+
+                try:
+                    data = root.parse(filename, dir)
+                except Exception as e:
+                    errors.append(e)
+                    data = None
+                else:
+                    if root.cache is not None:
+                        root.cache.store(filename, signature, data)
+
+                root.results[index] = (filename, dir, data)
+
+        threads = [threading.Thread(target=worker) for x in range(self.workers)]
+
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        try:
+            self._walk(tasks)
+        finally:
+            for thread in threads:
+                tasks.put(None)
+
+            for thread in threads:
+                thread.join()
+
+        if errors:
+            raise errors[0]
+
+        for root in self.roots:
+            # Drop files which vanished or couldn't be parsed
+            root.results = [x for x in root.results
+                            if x is not None and x[2] is not None]
+            self.stats.parsed += len(root.results)
+
+        self.stats.elapsed = clock() - start
+
+        return self.roots
+
+    def _walk(self, tasks):
+        # Depth first, iterative walk over every root at once. Each root keeps
+        # its own results list, with a slot reserved per file in walk order so
+        # that results don't depend on which thread finished first.
+        pending = [(root, root.directory) for root in reversed(self.roots)]
+
+        for root in self.roots:
+            root.results = []
+            root.found = 0
+
+        while pending:
+            root, curdir = pending.pop()
+
+            walkstart = clock()
+
+            try:
+                entries = sorted(iterDirectory(curdir))
+            except OSError:
+                # Unreadable or vanished directory
+                continue
+            finally:
+                self.stats.walktime += clock() - walkstart
+
+            self.stats.directories += 1
+            subdirs = []
+
+            for name, path, isdir, stat in entries:
+                if isdir:
+                    subdirs.append((root, path))
+
+                elif name.endswith(root.extension):
+                    index = len(root.results)
+                    root.results.append(None)
+                    root.found += 1
+                    self.stats.found += 1
+                    signature = None
+
+                    if root.cache is not None:
+                        try:
+                            signature = fileSignature(stat())
+                        except OSError:
+                            continue
+
+                        data = root.cache.lookup(path, signature)
+
+                        if data is not MISSING:
+                            # Unchanged since it was last parsed
+                            root.results[index] = (path, curdir, data)
+                            self.stats.cached += 1
+                            continue
+
+                    tasks.put((root, index, path, curdir, signature))
+
+            pending.extend(reversed(subdirs))
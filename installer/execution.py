@@ -0,0 +1,418 @@
+try:
+    # Python 2.x
+    import Queue as queue
+except(ImportError):
+    # Python 3.x
+    import queue
+
+import errno
+import heapq
+import os
+import subprocess
+import threading
+import time
+
+from core import DependencyCycleError
+from history import RunRecord
+
+DEFAULT_WORKERS = 4
+
+def waitProcess(process, block=True):
+    # Wait for a child process, returning (exitcode, cpu seconds, peak RSS in
+    # kilobytes). The usage figures are None where the platform can't say.
+    # Unless block is set, returns None straight away if it's still running.
+    if not hasattr(os, "wait4"):
+        exitcode = process.wait() if block else process.poll()
+        return None if exitcode is None else (exitcode, None, None)
+
+    while True:
+        try:
+            pid, status, usage = os.wait4(process.pid, 0 if block else os.WNOHANG)
+            break
+        except OSError as e:
+            if e.errno == errno.EINTR:
+                continue
+            if e.errno == errno.ECHILD:
+                # Already reaped elsewhere
+                return process.wait(), None, None
+            raise
+
+    if not pid:
+        # Still running
+        return None
+
+    if os.WIFSIGNALED(status):
+        process.returncode = -os.WTERMSIG(status)
+    else:
+        process.returncode = os.WEXITSTATUS(status)
+
+    return process.returncode, usage.ru_utime + usage.ru_stime, usage.ru_maxrss
+
+def runCommand(item, name, command, cmdresult):
+    # Run a single install command from the item's directory, returning its
+    # exit code, and noting the resources it used in cmdresult.
+    process = subprocess.Popen(command, shell=True, cwd=item.cwd)
+    exitcode, cmdresult.cputime, cmdresult.maxrss = waitProcess(process)
+    return exitcode
+
+def dryRunCommand(item, name, command, cmdresult):
+    return 0
+
+class CommandResult(object):
+    """Outcome of one of an item's commands"""
+    def __init__(self, name, command):
+        self.name = name
+        self.command = command
+        self.started = None # time.time() values
+        self.finished = None
+        self.exitcode = None
+        self.timedout = False # Killed for taking too long
+        self.cputime = None # User + system seconds, if known
+        self.maxrss = None # Peak resident set size in kilobytes, if known
+        self.resumed = False # Already done by an earlier, interrupted run
+
+    @property
+    def duration(self):
+        if self.started is None or self.finished is None:
+            return None
+
+        return self.finished - self.started
+
+class ItemResult(object):
+    """Outcome of installing an item, i.e. running all of its commands"""
+    def __init__(self, id):
+        self.id = id
+        self.started = None # time.time() values
+        self.finished = None
+        self.exitcode = None # Of the last command run, None if none ran
+        self.skipped = False # A dependency failed, so nothing was run
+        self.cancelled = False # The run was stopped before this finished
+        self.error = None # Exception that stopped the item part way, if any
+        self.commands = [] # [CommandResult, ...], in the order they ran
+
+    @property
+    def duration(self):
+        if self.started is None or self.finished is None:
+            return None
+
+        return self.finished - self.started
+
+    def succeeded(self):
+        return not self.skipped and not self.cancelled and not self.exitcode
+
+    def __repr__(self):
+        if self.skipped:
+            return "<ItemResult %s skipped>" % self.id
+
+        return "<ItemResult %s exit %r in %.2fs>" % (self.id, self.exitcode, self.duration or 0)
+
+class InstallGraph(object):
+    """The dependency graph between a set of items about to be installed.
+    Dependencies outside the set are assumed to be taken care of already."""
+
+    def __init__(self, items):
+        self.items = items # { id: InstallItem, ... }
+        self.depends = {} # { id: [id, ...], ... }, only within the set
+        self.dependents = {} # The reverse of depends
+
+        for id in items:
+            self.dependents[id] = []
+
+        for id, item in items.items():
+            self.depends[id] = [x for x in item.depends if x in items]
+
+            for dep in self.depends[id]:
+                self.dependents[dep].append(id)
+
+        self.order = self.topologicalOrder()
+
+    def topologicalOrder(self):
+        # Kahn's algorithm, raising DependencyCycleError if the graph loops
+        remaining = dict((id, len(deps)) for id, deps in self.depends.items())
+        ready = sorted(id for id, count in remaining.items() if not count)
+        order = []
+
+        while ready:
+            id = ready.pop(0)
+            order.append(id)
+
+            for dependent in self.dependents[id]:
+                remaining[dependent] -= 1
+
+                if not remaining[dependent]:
+                    ready.append(dependent)
+
+        if len(order) < len(self.items):
+            raise(DependencyCycleError(self.findCycle(set(self.items) - set(order))))
+
+        return order
+
+    def findCycle(self, ids):
+        # Every one of ids is on or behind a cycle, so following dependencies
+        # from any of them must eventually come back around.
+        id = min(ids)
+        path = []
+
+        while not id in path:
+            path.append(id)
+            id = min(x for x in self.depends[id] if x in ids)
+
+        return path[path.index(id):] + [id]
+
+    def roots(self):
+        return [id for id in self.order if not self.depends[id]]
+
+class CriticalPathScheduler(object):
+    """Decides which ready item runs next: the one with the longest chain of
+    work still behind it, so long dependency chains start as early as they
+    can instead of holding up the end of the run.
+
+    Items are weighed with the weights callable, taking an item and
+    returning its expected duration in seconds (or None if unknown). Items
+    it can't weigh count `default` seconds per command."""
+
+    def __init__(self, weights=None, default=1.0):
+        self.weights = weights
+        self.default = default
+        self.weight = {} # { id: seconds, ... } for the prepared graph
+        self.rank = {} # { id: seconds of the longest path from id, ... }
+
+    def weigh(self, item):
+        if self.weights is not None:
+            weight = self.weights(item)
+
+            if weight is not None:
+                return weight
+
+        return self.default * max(1, len(item.commands))
+
+    def prepare(self, graph):
+        # Work out every item's rank, from the end of the graph backwards
+        self.weight = dict((id, self.weigh(item)) for id, item in graph.items.items())
+        self.rank = {}
+
+        for id in reversed(graph.order):
+            behind = [self.rank[x] for x in graph.dependents[id]]
+            self.rank[id] = self.weight[id] + max(behind or [0])
+
+    def pick(self, graph, ready):
+        return max(ready, key=lambda id: (self.rank[id], id))
+
+    def criticalPath(self, graph):
+        # The chain of ids that bounds the run, however many workers there are
+        path = []
+        candidates = graph.roots()
+
+        while candidates:
+            id = max(candidates, key=lambda x: (self.rank[x], x))
+            path.append(id)
+            candidates = graph.dependents[id]
+
+        return path
+
+    def makespan(self, graph, workers):
+        # Predict how long the run takes, by playing it out with the weights
+        # standing in for real durations.
+        self.prepare(graph)
+        remaining = dict((id, len(deps)) for id, deps in graph.depends.items())
+        ready = graph.roots()
+        running = [] # Heap of (finish time, id)
+        now = 0.0
+
+        while ready or running:
+            while ready and len(running) < workers:
+                id = self.pick(graph, ready)
+                ready.remove(id)
+                heapq.heappush(running, (now + self.weight[id], id))
+
+            now, id = heapq.heappop(running)
+
+            for dependent in graph.dependents[id]:
+                remaining[dependent] -= 1
+
+                if not remaining[dependent]:
+                    ready.append(dependent)
+
+        return now
+
+class InstallEngine(object):
+    """Installs a set of items, running each item's commands in order, once
+    all of its dependencies have installed successfully. Items which don't
+    depend on each other are run at the same time, on a pool of workers.
+
+    Which ready item goes next is up to the scheduler, by default the one
+    heading the longest chain of remaining work.
+
+    The listener, if given, is told about progress from the calling thread:
+        itemStarted(id), itemFinished(ItemResult)"""
+
+    def __init__(self, workers=DEFAULT_WORKERS, runner=runCommand, listener=None,
+                 scheduler=None, history=None, journal=None):
+        self.workers = max(1, workers)
+        self.runner = runner # Callable taking (item, name, command, CommandResult)
+        self.listener = listener
+        self.history = history # RunHistory to record into and estimate from
+        self.journal = journal # InstallJournal noting each completed command
+        self.completed = set() # (id, command name) to skip, for this run
+
+        if scheduler is None:
+            scheduler = CriticalPathScheduler(history.weigh if history is not None else None)
+
+        self.scheduler = scheduler
+
+    def predict(self, items, percentile=None):
+        # Expected duration of installing items, in seconds, before running.
+        # With a percentile (0-100), each command is taken to last that
+        # percentile of its past runs rather than their mean.
+        scheduler = self.scheduler
+
+        if percentile is not None and self.history is not None:
+            scheduler = CriticalPathScheduler(lambda item: self.history.weigh(item, percentile))
+
+        return scheduler.makespan(InstallGraph(items), self.workers)
+
+    def run(self, items, completed=None):
+        # Install every item in the { id: InstallItem } dict, returning a dict
+        # of ItemResults by id. Commands listed in completed, as (id, command
+        # name), were done by an earlier run and are skipped.
+        self.completed = completed or set()
+        graph = InstallGraph(items)
+        self.scheduler.prepare(graph)
+        results = dict((id, ItemResult(id)) for id in items)
+        remaining = dict((id, len(deps)) for id, deps in graph.depends.items())
+        ready = graph.roots()
+
+        tasks = queue.Queue()
+        finished = queue.Queue()
+        threads = [threading.Thread(target=self._worker, args=(graph, results, tasks, finished))
+                   for x in range(self.workers)]
+
+        for thread in threads:
+            thread.daemon = True
+            thread.start()
+
+        running = 0
+        outstanding = len(items)
+
+        try:
+            while outstanding:
+                # Only hand out as much work as there are idle workers, so the
+                # choice of what runs next is made as late as possible.
+                while ready and running < self.workers:
+                    id = self.nextReady(graph, ready)
+                    ready.remove(id)
+                    running += 1
+                    self._notify("itemStarted", id)
+                    tasks.put(id)
+
+                id = finished.get()
+                running -= 1
+                outstanding -= 1
+                result = results[id]
+                self._notify("itemFinished", result)
+
+                if result.succeeded():
+                    for dependent in graph.dependents[id]:
+                        remaining[dependent] -= 1
+
+                        if not remaining[dependent]:
+                            ready.append(dependent)
+                else:
+                    outstanding -= self._skipDependents(graph, results, id)
+        finally:
+            for thread in threads:
+                tasks.put(None)
+
+            for thread in threads:
+                thread.join()
+
+        return results
+
+    def nextReady(self, graph, ready):
+        return self.scheduler.pick(graph, ready)
+
+    def _skipDependents(self, graph, results, id):
+        # Mark everything behind a failed item as skipped
+        skipped = 0
+        pending = list(graph.dependents[id])
+
+        while pending:
+            dependent = pending.pop()
+            result = results[dependent]
+
+            if result.skipped:
+                continue
+
+            result.skipped = True
+            skipped += 1
+            self._notify("itemFinished", result)
+            pending.extend(graph.dependents[dependent])
+
+        return skipped
+
+    def _worker(self, graph, results, tasks, finished):
+        while True:
+            id = tasks.get()
+
+            if id is None:
+                return
+
+            try:
+                self.installItem(graph.items[id], results[id])
+            except Exception as e:
+                # E.g. the journal couldn't be written. The item's failed, but
+                # the worker carries on, or run() would wait on it forever.
+                results[id].error = e
+                results[id].exitcode = -1
+            finally:
+                finished.put(id)
+
+    def installItem(self, item, result):
+        result.started = time.time()
+
+        try:
+            for name, command in item.commands.items():
+                cmdresult = CommandResult(name, command)
+                result.commands.append(cmdresult)
+
+                if self.resumeCommand(item, cmdresult):
+                    continue
+
+                cmdresult.started = time.time()
+
+                try:
+                    cmdresult.exitcode = self.runner(item, name, command, cmdresult)
+                except Exception:
+                    # Couldn't even be started
+                    cmdresult.exitcode = -1
+
+                cmdresult.finished = time.time()
+                result.exitcode = cmdresult.exitcode
+                self.recordCommand(item, cmdresult)
+
+                if cmdresult.exitcode:
+                    # Don't carry on with a half installed item
+                    break
+        finally:
+            result.finished = time.time()
+
+    def resumeCommand(self, item, cmdresult):
+        # Mark the command done if an earlier run already did it
+        if not (item.id, cmdresult.name) in self.completed:
+            return False
+
+        cmdresult.resumed = True
+        cmdresult.exitcode = 0
+        return True
+
+    def recordCommand(self, item, cmdresult):
+        if self.journal is not None:
+            self.journal.commandDone(item.id, cmdresult.name, cmdresult.exitcode)
+
+        if self.history is not None:
+            self.history.record(RunRecord(item.id, cmdresult.name, cmdresult.duration,
+                cmdresult.cputime, cmdresult.maxrss, cmdresult.exitcode))
+
+    def _notify(self, event, *args):
+        if self.listener is not None:
+            getattr(self.listener, event)(*args)
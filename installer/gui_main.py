@@ -19,7 +19,7 @@ class Ui_Wizard(object):
         Wizard.setObjectName(_fromUtf8("Wizard"))
         Wizard.resize(487, 482)
         icon = QtGui.QIcon()
-        icon.addPixmap(QtGui.QPixmap(_fromUtf8(":/App/icons/app.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
+        icon.addPixmap(QtGui.QPixmap(_fromUtf8("App:icons/app.png")), QtGui.QIcon.Normal, QtGui.QIcon.Off)
         Wizard.setWindowIcon(icon)
         Wizard.setSizeGripEnabled(False)
         Wizard.setOptions(QtGui.QWizard.CancelButtonOnLeft)
@@ -209,4 +209,3 @@ class Ui_Wizard(object):
         self.label_3.setText(QtGui.QApplication.translate("Wizard", "All items:", None, QtGui.QApplication.UnicodeUTF8))
 
 from mixedtreeview import MixedTreeView
-import installer_rc
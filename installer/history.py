@@ -0,0 +1,137 @@
+import json
+import threading
+import time
+
+# How many recent runs of a command to base its estimate on
+SAMPLES = 10
+
+def formatDuration(seconds):
+    # Rough, human friendly duration: "about 12 minutes"
+    if seconds is None:
+        return "unknown"
+
+    if seconds < 60:
+        return "under a minute"
+
+    minutes = int(round(seconds / 60.0))
+
+    if minutes < 60:
+        return "about %d minute%s" % (minutes, "s" if minutes != 1 else "")
+
+    hours = seconds / 3600.0
+    return "about %.1f hours" % hours
+
+class RunRecord(object):
+    """Resources used by one run of an item's command"""
+    def __init__(self, id, command, wall, cpu=None, rss=None, exitcode=0, when=None):
+        self.id = id
+        self.command = command # The command's name within the item
+        self.wall = wall # Seconds
+        self.cpu = cpu # User + system seconds, if known
+        self.rss = rss # Peak resident set size in kilobytes, if known
+        self.exitcode = exitcode
+        self.when = when or time.time()
+
+    def toDict(self):
+        return {"id": self.id, "command": self.command, "wall": self.wall,
+                "cpu": self.cpu, "rss": self.rss, "exit": self.exitcode,
+                "when": self.when}
+
+    @classmethod
+    def fromDict(cls, data):
+        return cls(data["id"], data["command"], data["wall"], data.get("cpu"),
+                   data.get("rss"), data.get("exit", 0), data.get("when"))
+
+class RunHistory(object):
+    """Append-only log of how long each item's commands took, one JSON record
+    per line, with estimates of how long they'll take next time."""
+
+    def __init__(self, filename, samples=SAMPLES):
+        self.filename = filename
+        self.samples = samples
+        self.runs = {} # { (id, command): [wall seconds, ...], ... }, successes only
+        self._typical = None # Cached result of typical()
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        self.runs = {}
+        self._typical = None
+
+        try:
+            f = open(self.filename)
+        except IOError:
+            return
+
+        with f:
+            for line in f:
+                try:
+                    record = RunRecord.fromDict(json.loads(line))
+                except (ValueError, KeyError, TypeError):
+                    # Torn write, or junk
+                    continue
+
+                self._remember(record)
+
+    def _remember(self, record):
+        if record.exitcode:
+            # Failures say little about how long a real install takes
+            return
+
+        walls = self.runs.setdefault((record.id, record.command), [])
+        walls.append(record.wall)
+        del walls[:-self.samples]
+        self._typical = None
+
+    def record(self, record):
+        with self._lock:
+            self._remember(record)
+
+            try:
+                with open(self.filename, "a") as f:
+                    f.write(json.dumps(record.toDict()) + "\n")
+            except IOError:
+                # The history is a nicety; never fail an install over it
+                pass
+
+    def estimate(self, id, command, percentile=None):
+        # Expected seconds for a command: the mean of its recent runs, or the
+        # given percentile (0-100) of them. None if it's never been run.
+        walls = self.runs.get((id, command))
+
+        if not walls:
+            return None
+
+        if percentile is None:
+            return sum(walls) / len(walls)
+
+        walls = sorted(walls)
+        index = int(round((len(walls) - 1) * percentile / 100.0))
+        return walls[index]
+
+    def typical(self):
+        # Median of every command's estimate, for commands with no history
+        if self._typical is None and self.runs:
+            estimates = sorted(self.estimate(id, command) for id, command in self.runs)
+            self._typical = estimates[len(estimates) // 2]
+
+        return self._typical
+
+    def weigh(self, item, percentile=None):
+        # Expected seconds for all of an item's commands. Commands never seen
+        # before count as a typical command; None if nothing's known at all.
+        typical = self.typical()
+        total = 0.0
+
+        for name in item.commands:
+            estimate = self.estimate(item.id, name, percentile)
+
+            if estimate is None:
+                estimate = typical
+
+            if estimate is None:
+                return None
+
+            total += estimate
+
+        return total
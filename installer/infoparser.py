@@ -0,0 +1,170 @@
+try:
+    # Python 2.x
+    import ConfigParser
+except(ImportError):
+    # Python 3.x
+    import configparser as ConfigParser
+
+import re
+
+# The same section headers RawConfigParser accepts
+SECTIONRE = re.compile(r"\[(?P<header>[^]]+)\]")
+
+# Options read from item and preset files. None means every option.
+ITEMKEYS = {
+    "Core": set(["name", "id", "summary", "tooltip", "helptext", "checktype",
+                 "depends", "categories"]),
+    "Commands": None,
+}
+
+PRESETKEYS = {
+    "Core": set(["name", "id", "includes", "excludes"]),
+}
+
+class InfoParseError(ConfigParser.Error):
+    pass
+
+class InfoFile(object):
+    """The wanted options of an info or preset file, answering the handful
+    of ConfigParser methods the core uses"""
+
+    def __init__(self):
+        self.sections = {} # { section: { option: value, ... } }, wanted ones only
+        self.order = {} # { section: [option, ...] }, as first seen
+        self.names = set() # Every section in the file
+
+    def has_section(self, section):
+        return section in self.names
+
+    def has_option(self, section, option):
+        return section in self.sections and option.lower() in self.sections[section]
+
+    def get(self, section, option):
+        try:
+            return self.sections[section][option.lower()]
+        except KeyError:
+            raise(ConfigParser.NoOptionError(option, section))
+
+    def items(self, section):
+        if not section in self.names:
+            raise(ConfigParser.NoSectionError(section))
+
+        options = self.sections.get(section, {})
+        return [(x, options[x]) for x in self.order.get(section, ())]
+
+def readConfigParser(filename):
+    # The general purpose way, for files needing what only it supports
+    parser = ConfigParser.SafeConfigParser()
+    parser.read(filename)
+    return parser
+
+def readInfo(filename, wanted):
+    # Read an info or preset file in one pass, keeping only the options in
+    # wanted, { section: set of lower case options or None for all, ... }.
+    # Files using interpolation or a DEFAULT section are handed to
+    # SafeConfigParser, as only it gets those right. Either way the results
+    # are the same, and unparsable files raise ConfigParser.Error.
+    try:
+        with open(filename) as f:
+            text = f.read()
+    except IOError:
+        # As ConfigParser.read, a file that can't be read has no sections
+        return InfoFile()
+
+    if "%" in text:
+        return readConfigParser(filename)
+
+    info = InfoFile()
+    section = None # Name of the current section
+    values = None # { option: [line, ...] } for the current section, None if it's not wanted
+    order = None # Options of the current section, as first seen
+    keep = None # Options wanted from the current section, None for all
+    option = None # Last option seen, for continuation lines
+    errors = []
+
+    for number, line in enumerate(text.split("\n")):
+        first = line[:1]
+
+        if not first or first in "#;" or not line.strip():
+            continue
+
+        if first in "rR" and line.split(None, 1)[0].lower() == "rem":
+            continue
+
+        if first.isspace():
+            if section is not None and option:
+                # Continuation of the last option's value
+                value = line.strip()
+
+                if value and values is not None and option in values:
+                    values[option].append(value)
+            else:
+                errors.append(number + 1)
+
+            continue
+
+        match = first == "[" and SECTIONRE.match(line)
+
+        if match:
+            section = match.group("header")
+            option = None
+
+            if section == ConfigParser.DEFAULTSECT:
+                return readConfigParser(filename)
+
+            info.names.add(section)
+
+            if section in wanted:
+                keep = wanted[section]
+                values = info.sections.setdefault(section, {})
+                order = info.order.setdefault(section, [])
+            else:
+                values = None
+
+            continue
+
+        if section is None:
+            raise(InfoParseError("%s has no section header before line %d" % (filename, number + 1)))
+
+        # "option = value" or "option: value", split at whichever comes first
+        equals = line.find("=")
+        colon = line.find(":")
+        split = equals if colon < 0 or 0 <= equals < colon else colon
+
+        if split <= 0:
+            errors.append(number + 1)
+            continue
+
+        option = line[:split].rstrip().lower()
+
+        if values is None or (keep is not None and not option in keep):
+            continue
+
+        value = line[split + 1:].lstrip()
+
+        if ";" in value:
+            # An inline comment, if there's space before it
+            pos = value.find(";")
+
+            if value[pos - 1].isspace():
+                value = value[:pos]
+
+        value = value.strip()
+
+        if value == '""':
+            value = ""
+
+        # Later values win, keeping the first one's place
+        if not option in values:
+            order.append(option)
+
+        values[option] = [value]
+
+    if errors:
+        raise(InfoParseError("%s can't be parsed at lines %s" % (filename, errors)))
+
+    for options in info.sections.values():
+        for option in options:
+            options[option] = "\n".join(options[option])
+
+    return info
@@ -0,0 +1,95 @@
+import json
+import os
+import threading
+import time
+
+class JournalState(object):
+    """What a journal says about an install run"""
+    def __init__(self):
+        self.ids = [] # Item ids selected for the run
+        self.completed = set() # (id, command name) of commands which succeeded
+        self.finished = False # The run got to the end
+
+class InstallJournal(object):
+    """Write-ahead journal of an install run, one JSON record per line: the
+    selection when the run starts, then every command as it completes.
+
+    Each record is handed to the OS as soon as it's written, which is enough
+    to survive the process dying or a clean reboot. fsync, needed to survive
+    power loss, is batched: every `batch` records or `interval` seconds,
+    whichever comes first, and always at the start and end of a run."""
+
+    def __init__(self, filename, batch=16, interval=1.0):
+        self.filename = filename
+        self.batch = batch
+        self.interval = interval
+        self.file = None
+        self._unsynced = 0
+        self._lastsync = 0
+        self._lock = threading.Lock() # Workers report commands concurrently
+
+    def start(self, ids):
+        # Begin a new run, replacing whatever the journal held before
+        self.file = open(self.filename, "w")
+        self._write({"type": "run", "ids": sorted(ids), "when": time.time()})
+        self.sync()
+
+    def reopen(self):
+        # Carry on with the run already in the journal
+        self.file = open(self.filename, "a")
+
+    def commandDone(self, id, name, exitcode):
+        with self._lock:
+            self._write({"type": "command", "id": id, "command": name,
+                         "exit": exitcode, "when": time.time()})
+
+            if self._unsynced >= self.batch or time.time() - self._lastsync >= self.interval:
+                self.sync()
+
+    def finish(self):
+        self._write({"type": "done", "when": time.time()})
+        self.close()
+
+    def sync(self):
+        if self.file is None:
+            return
+
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self._unsynced = 0
+        self._lastsync = time.time()
+
+    def close(self):
+        if self.file is not None:
+            self.sync()
+            self.file.close()
+            self.file = None
+
+    def _write(self, record):
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        self._unsynced += 1
+
+    @staticmethod
+    def read(filename):
+        # Replay a journal into a JournalState. A torn final line, from a
+        # crash part way through a write, is ignored.
+        state = JournalState()
+
+        with open(filename) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    kind = record["type"]
+                except (ValueError, KeyError, TypeError):
+                    continue
+
+                if kind == "run":
+                    state = JournalState()
+                    state.ids = record.get("ids", [])
+                elif kind == "command" and not record.get("exit"):
+                    state.completed.add((record["id"], record["command"]))
+                elif kind == "done":
+                    state.finished = True
+
+        return state
@@ -9,6 +9,18 @@ from PyQt4 import QtCore, QtGui
 
 import treeitems
 
+def rowRanges(rows):
+    # Coalesce row numbers into [(first, last), ...] runs of neighbours
+    ranges = []
+    
+    for row in sorted(set(rows)):
+        if ranges and ranges[-1][1] == row - 1:
+            ranges[-1][1] = row
+        else:
+            ranges.append([row, row])
+            
+    return [tuple(x) for x in ranges]
+
 class MixedTreeModel(QtCore.QAbstractItemModel):
     """The model to be followed for showing data in the TreeView"""
     
@@ -26,6 +38,48 @@ class MixedTreeModel(QtCore.QAbstractItemModel):
         self.rootItem = data.rootItem()
         self.rootItem.name = "Item"
         self.rootItem.summary = "Summary"
+        
+        # Get told about individual rows coming and going on Core.refresh
+        data.setTreeListener(self)
+        
+    def indexForItem(self, item):
+        if item is None or item is self.rootItem:
+            return QtCore.QModelIndex()
+        
+        return self.createIndex(item.row(), 0, item)
+    
+    def childrenAboutToBeInserted(self, parent, first, last):
+        self.beginInsertRows(self.indexForItem(parent), first, last)
+        
+    def childrenInserted(self):
+        self.endInsertRows()
+        
+    def childrenAboutToBeRemoved(self, parent, first, last):
+        self.beginRemoveRows(self.indexForItem(parent), first, last)
+        
+    def childrenRemoved(self):
+        self.endRemoveRows()
+        
+    def selectionChanged(self, ids):
+        # Repaint only the rows showing these ids, including every copy of
+        # each, with one dataChanged per run of neighbouring rows
+        rows = {} # { parent item: [row, ...], ... }
+        items = self.rootConfig.installerItems()
+        
+        for id in ids:
+            record = items.get(id)
+            
+            if record is None:
+                continue
+            
+            for item in record.placements:
+                if item.parentItem is not None and item.row() >= 0:
+                    rows.setdefault(item.parentItem, []).append(item.row())
+                    
+        for parent, parentrows in rows.items():
+            for first, last in rowRanges(parentrows):
+                self.dataChanged.emit(self.createIndex(first, 0, parent.child(first)),
+                                      self.createIndex(last, 0, parent.child(last)))
 
     def columnCount(self, parent):
         return 2
@@ -56,10 +110,12 @@ class MixedTreeModel(QtCore.QAbstractItemModel):
         if role == QtCore.Qt.CheckStateRole:
             item = index.internalPointer()
             
-            self.checkStateChangeRequest.emit(item, not item.isChecked())
+            # Whatever the handler changes is repainted once it's done,
+            # through selectionChanged
+            with self.rootConfig.installerItems().selection.batch():
+                self.checkStateChangeRequest.emit(item, not item.isChecked())
             
             status = True
-            self.refreshList()
                 
         return status
 
@@ -81,9 +137,6 @@ class MixedTreeModel(QtCore.QAbstractItemModel):
 
         return None
 
-    def refreshList(self):
-        self.layoutChanged.emit()
-    
     def index(self, row, column, parent):
         if not self.hasIndex(row, column, parent):
             return QtCore.QModelIndex()
@@ -107,11 +160,31 @@ class MixedTreeModel(QtCore.QAbstractItemModel):
         childItem = index.internalPointer()
         parentItem = childItem.parent()
         
-        if parentItem == self.rootItem:
+        if parentItem is self.rootItem:
             return QtCore.QModelIndex()
         
         return self.createIndex(parentItem.row(), 0, parentItem)
 
+    def itemForIndex(self, index):
+        if not index.isValid():
+            return self.rootItem
+        
+        return index.internalPointer()
+        
+    def hasChildren(self, parent):
+        # Children not fetched yet still count, so the item can be expanded
+        return self.itemForIndex(parent).childCount() > 0 or self.canFetchMore(parent)
+        
+    def canFetchMore(self, parent):
+        if self.rootConfig is None:
+            return False
+        
+        return self.rootConfig.canFetchChildren(self.itemForIndex(parent))
+        
+    def fetchMore(self, parent):
+        # Core tells us about the rows it adds, as with refresh
+        self.rootConfig.fetchChildren(self.itemForIndex(parent))
+        
     def rowCount(self, parent):
         if parent.column() > 0:
             return 0
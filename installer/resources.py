@@ -0,0 +1,30 @@
+import os
+import sys
+
+from PyQt4 import QtCore
+
+PREFIX = "App"
+
+def resourceDir():
+    # Where the artwork lives: beside the executable when frozen, otherwise
+    # beside this module
+    if hasattr(sys, "frozen"):
+        return os.path.dirname(os.path.abspath(sys.executable))
+
+    return os.path.dirname(os.path.abspath(__file__))
+
+def registerResources(basedir=None):
+    # Make "App:images/banner.png" and friends resolve, without reading any
+    # artwork until it's first asked for. A binary bundle, built with
+    #     rcc -binary installer.qrc -o installer.rcc
+    # is preferred if there is one, and memory mapped by Qt where it can be.
+    # Failing that the files are read straight from images/ and icons/.
+    basedir = basedir or resourceDir()
+    paths = []
+    rccfile = os.path.join(basedir, "installer.rcc")
+
+    if os.path.exists(rccfile) and QtCore.QResource.registerResource(rccfile):
+        paths.append(":/" + PREFIX)
+
+    paths.append(basedir)
+    QtCore.QDir.setSearchPaths(PREFIX, paths)
@@ -0,0 +1,214 @@
+try:
+    # Python 2.x
+    from itertools import imap
+except(ImportError):
+    # Python 3.x
+    imap = map
+
+import binascii
+import contextlib
+import operator
+from itertools import compress
+
+# Byte translation table swapping 0 and 1, for inverting in one pass
+_INVERT = bytearray(range(256))
+_INVERT[0], _INVERT[1] = 1, 0
+_INVERT = bytes(_INVERT)
+
+def _toInt(bits):
+    # A 0/1 bytearray as one big integer with a bit set per checked byte, so
+    # masks can be combined with integer operators in a single C-level pass.
+    if not bits:
+        return 0
+
+    return int(binascii.hexlify(bytes(bits)), 16)
+
+def _fromInt(value, length):
+    if not length:
+        return bytearray()
+
+    return bytearray(binascii.unhexlify("%0*x" % (length * 2, value)))
+
+class SelectionState(object):
+    """Checked state for every item id, kept as one byte per id in a dense
+    bytearray. Ids are given an index the first time they're seen, and keep
+    it for the life of the selection.
+
+    If there's a listener, its selectionChanged(ids) is called with the ids
+    whose state actually changed, once per change, or once per batch()."""
+
+    def __init__(self):
+        self.indexes = {} # { id: index, ... }
+        self.ids = [] # [id, ...], by index
+        self.bits = bytearray() # 1 for checked, 0 otherwise, by index
+        self.listener = None
+        self._changed = None # Set of ids changed so far in a batch
+        self._depth = 0 # Of nested batches
+
+    def __len__(self):
+        return len(self.ids)
+
+    def indexOf(self, id):
+        index = self.indexes.get(id)
+
+        if index is None:
+            index = self.indexes[id] = len(self.ids)
+            self.ids.append(id)
+            self.bits.append(0)
+
+        return index
+
+    def isSet(self, id):
+        index = self.indexes.get(id)
+
+        if index is None:
+            return False
+
+        return self.bits[index] == 1
+
+    def batch(self):
+        # For a with statement: tell the listener about everything changed
+        # within, all at once. Used on every check, so no contextmanager.
+        return self
+
+    def __enter__(self):
+        if self.listener is not None:
+            self._depth += 1
+
+            if self._changed is None:
+                self._changed = set()
+
+        return self
+
+    def __exit__(self, *exc):
+        if self._changed is None:
+            return
+
+        self._depth -= 1
+
+        if not self._depth:
+            changed, self._changed = self._changed, None
+
+            if changed and self.listener is not None:
+                self.listener.selectionChanged(list(changed))
+
+    def _noteChanged(self, ids):
+        if self._changed is not None:
+            self._changed.update(ids)
+        elif ids and self.listener is not None:
+            self.listener.selectionChanged(ids)
+
+    def set(self, id, value):
+        index = self.indexOf(id)
+        value = 1 if value else 0
+
+        if self.bits[index] != value:
+            self.bits[index] = value
+
+            if self.listener is not None:
+                self._noteChanged([id])
+
+    def setMany(self, ids, value):
+        value = 1 if value else 0
+        changed = []
+
+        for id in ids:
+            index = self.indexOf(id)
+
+            if self.bits[index] != value:
+                self.bits[index] = value
+                changed.append(id)
+
+        if self.listener is not None:
+            self._noteChanged(changed)
+
+    def mask(self, ids):
+        # A bytearray with a 1 for each of the given ids, for the bulk methods
+        mask = bytearray(len(self.bits))
+
+        for id in ids:
+            index = self.indexOf(id)
+
+            if index >= len(mask):
+                mask.extend(bytearray(index - len(mask) + 1))
+
+            mask[index] = 1
+
+        return mask
+
+    def _padded(self, other):
+        # Bring a mask or snapshot taken earlier up to the current length
+        other = bytearray(other)
+
+        if len(other) < len(self.bits):
+            other.extend(bytearray(len(self.bits) - len(other)))
+
+        return other
+
+    @contextlib.contextmanager
+    def _bulk(self):
+        # Work out what a bulk operation changed, if anyone wants to know
+        if self.listener is None:
+            yield
+            return
+
+        before = self.snapshot()
+        yield
+        self._noteChanged(self.differences(before))
+
+    def setAll(self, value, mask=None):
+        # Check or uncheck every id, or only those in mask
+        with self._bulk():
+            self._setAll(value, mask)
+
+    def _setAll(self, value, mask):
+        length = len(self.bits)
+
+        if mask is None:
+            self.bits[:] = bytearray([1 if value else 0]) * length
+            return
+
+        bits = _toInt(self.bits)
+        mask = _toInt(self._padded(mask))
+
+        if value:
+            bits |= mask
+        else:
+            bits ^= bits & mask
+
+        self.bits[:] = _fromInt(bits, length)
+
+    def invert(self, mask=None):
+        # Flip every id, or only those in mask
+        with self._bulk():
+            self._invert(mask)
+
+    def _invert(self, mask):
+        if mask is None:
+            self.bits[:] = self.bits.translate(_INVERT)
+            return
+
+        length = len(self.bits)
+        self.bits[:] = _fromInt(_toInt(self.bits) ^ _toInt(self._padded(mask)), length)
+
+    def count(self, mask=None):
+        # Checked ids, or only those in mask
+        if mask is None:
+            return self.bits.count(b"\x01")
+
+        return bin(_toInt(self.bits) & _toInt(self._padded(mask))).count("1")
+
+    def checkedIds(self):
+        return list(compress(self.ids, self.bits))
+
+    def snapshot(self):
+        return bytes(self.bits)
+
+    def restore(self, snapshot):
+        with self._bulk():
+            self.bits[:] = self._padded(snapshot)[:len(self.bits)]
+
+    def differences(self, snapshot):
+        # Ids whose state differs from an earlier snapshot
+        return list(compress(self.ids,
+            imap(operator.ne, self.bits, self._padded(snapshot))))
@@ -0,0 +1,105 @@
+import contextlib
+import json
+import os
+import sys
+import threading
+import time
+
+class StartupReport(object):
+    """Times the phases of starting the wizard, and what the caches saved.
+    The phases can be printed as a summary once the window's up, and saved
+    as a Chrome trace (chrome://tracing, or Perfetto) to compare releases.
+    Costs next to nothing unless enabled."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.tracefile = None # Where to save the trace, if anywhere
+        self.started = time.time()
+        self.phases = [] # [(name, milliseconds), ...], in the order they ended
+        self.savings = [] # [(name, milliseconds), ...]
+        self.events = [] # Chrome trace events
+        self.pid = os.getpid()
+
+    def enable(self, tracefile=None):
+        self.enabled = True
+        self.tracefile = tracefile or self.tracefile
+
+    def _timestamp(self, when):
+        # Microseconds since the report was created
+        return int((when - self.started) * 1000000)
+
+    @contextlib.contextmanager
+    def phase(self, name, category="startup", **args):
+        # Time the body of the with statement. Phases may nest, and may run
+        # on any thread. The body is given args, to add details to.
+        if not self.enabled:
+            yield args
+            return
+
+        start = time.time()
+
+        try:
+            yield args
+        finally:
+            finish = time.time()
+            self.phases.append((name, (finish - start) * 1000))
+            self.events.append({"name": name, "cat": category, "ph": "X",
+                "ts": self._timestamp(start), "dur": self._timestamp(finish) - self._timestamp(start),
+                "pid": self.pid, "tid": threading.current_thread().ident, "args": args})
+
+    def saved(self, name, ms):
+        # Note time a cache saved over doing things the slow way
+        if not self.enabled:
+            return
+
+        self.savings.append((name, ms))
+        self.events.append({"name": "%s saved" % name, "cat": "startup", "ph": "i",
+            "s": "p", "ts": self._timestamp(time.time()), "pid": self.pid,
+            "tid": threading.current_thread().ident, "args": {"ms": round(ms, 1)}})
+
+    def mark(self, name):
+        # An instant in the trace, such as the window first being shown
+        if self.enabled:
+            self.events.append({"name": name, "cat": "startup", "ph": "i", "s": "g",
+                "ts": self._timestamp(time.time()), "pid": self.pid,
+                "tid": threading.current_thread().ident})
+
+    def trace(self):
+        # The whole report as a Chrome trace-event format document
+        events = [{"name": "process_name", "ph": "M", "pid": self.pid,
+                   "args": {"name": "pynstaller"}}]
+
+        for thread in threading.enumerate():
+            events.append({"name": "thread_name", "ph": "M", "pid": self.pid,
+                           "tid": thread.ident, "args": {"name": thread.name}})
+
+        return {"traceEvents": events + self.events, "displayTimeUnit": "ms",
+                "otherData": {"python": sys.version.split()[0], "platform": sys.platform,
+                              "argv": sys.argv, "started": self.started}}
+
+    def writeTrace(self, filename=None):
+        filename = filename or self.tracefile
+
+        if not self.enabled or not filename:
+            return
+
+        with open(filename, "w") as f:
+            json.dump(self.trace(), f, indent=1)
+
+    def write(self, stream=None):
+        if not self.enabled:
+            return
+
+        stream = stream or sys.stderr
+        stream.write("Startup timings:\n")
+
+        for name, ms in self.phases:
+            stream.write("  %-30s %8.1f ms\n" % (name, ms))
+
+        stream.write("  %-30s %8.1f ms\n" % ("total", (time.time() - self.started) * 1000))
+
+        for name, ms in self.savings:
+            stream.write("  %-30s %8.1f ms saved\n" % (name, ms))
+
+# Shared by main.py and Core, so the core's phases land in the same trace
+report = StartupReport()
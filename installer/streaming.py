@@ -0,0 +1,419 @@
+try:
+    # Python 2.x
+    import Queue as queue
+except(ImportError):
+    # Python 3.x
+    import queue
+
+import errno
+import os
+import select
+import signal
+import subprocess
+import threading
+import time
+
+from execution import InstallEngine, InstallGraph, ItemResult, CommandResult, waitProcess
+
+DEFAULT_CONCURRENCY = 64
+READSIZE = 65536
+
+# Longest the loop sleeps while a command that's closed its output runs on
+REAPINTERVAL = 0.05
+
+class OutputSink(object):
+    """Receives the output of install commands, a line at a time"""
+    def line(self, id, name, stream, text):
+        # stream is "stdout" or "stderr"
+        pass
+
+    def close(self):
+        pass
+
+class CallbackSink(OutputSink):
+    def __init__(self, callback):
+        self.callback = callback # Callable taking (id, name, stream, text)
+
+    def line(self, id, name, stream, text):
+        self.callback(id, name, stream, text)
+
+class LogFileSink(OutputSink):
+    def __init__(self, filename):
+        self.file = open(filename, "a")
+
+    def line(self, id, name, stream, text):
+        self.file.write("[%s/%s %s] %s\n" % (id, name, stream, text))
+
+    def close(self):
+        self.file.close()
+
+class PollPoller(object):
+    """Waits on many pipes at once from a single thread, with select.poll"""
+    def __init__(self):
+        self.poller = select.poll()
+        self.keys = {} # { fd: key, ... }
+
+    def register(self, pipe, key):
+        fd = pipe.fileno()
+        self.keys[fd] = key
+        self.poller.register(fd, select.POLLIN | select.POLLPRI)
+
+    def unregister(self, pipe):
+        fd = pipe.fileno()
+        del self.keys[fd]
+        self.poller.unregister(fd)
+
+    def poll(self, timeout):
+        # Return [(key, data), ...] for pipes with something to say. Empty
+        # data means the pipe was closed.
+        events = []
+
+        try:
+            ready = self.poller.poll(timeout * 1000)
+        except (select.error, IOError) as e:
+            if e.args[0] == errno.EINTR:
+                return events
+            raise
+
+        for fd, mask in ready:
+            try:
+                data = os.read(fd, READSIZE)
+            except OSError as e:
+                if e.errno == errno.EAGAIN:
+                    continue
+                data = ""
+
+            events.append((self.keys[fd], data))
+
+        return events
+
+class ThreadPoller(object):
+    """Fallback for platforms (Windows) whose select can't wait on pipes. A
+    reader thread per pipe feeds one queue; everything else stays on the
+    event loop's thread."""
+    def __init__(self):
+        self.events = queue.Queue()
+
+    def register(self, pipe, key):
+        def reader():
+            while True:
+                try:
+                    data = os.read(pipe.fileno(), READSIZE)
+                except (OSError, ValueError):
+                    # Closed under us by the event loop
+                    data = ""
+
+                self.events.put((key, data))
+
+                if not data:
+                    return
+
+        thread = threading.Thread(target=reader)
+        thread.daemon = True
+        thread.start()
+
+    def unregister(self, pipe):
+        pass
+
+    def poll(self, timeout):
+        events = []
+
+        try:
+            events.append(self.events.get(True, timeout))
+
+            while True:
+                events.append(self.events.get_nowait())
+        except queue.Empty:
+            pass
+
+        return events
+
+def makePoller():
+    if hasattr(select, "poll"):
+        return PollPoller()
+
+    return ThreadPoller()
+
+class RunningCommand(object):
+    """A child process, and where its output has got to"""
+    def __init__(self, item, result, commands):
+        self.item = item
+        self.result = result # ItemResult
+        self.commands = commands # Iterator over the rest of (name, command)
+        self.cmdresult = None # CommandResult of the current command
+        self.process = None
+        self.deadline = None
+        self.open = set() # Streams not closed yet
+        self.partial = {"stdout": "", "stderr": ""} # Unterminated lines
+
+class StreamingEngine(InstallEngine):
+    """Installs items like InstallEngine, but drives every child process from
+    a single event loop on the calling thread rather than a thread per item.
+    Output is streamed line by line to any number of OutputSinks. Each
+    command may be given a timeout, and cancel() may be called from any
+    thread to stop the run; running commands are terminated and anything
+    not yet started is skipped."""
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, sinks=None, timeout=None,
+                 listener=None, tick=0.25, scheduler=None, history=None, journal=None):
+        super(StreamingEngine, self).__init__(concurrency, listener=listener,
+            scheduler=scheduler, history=history, journal=journal)
+        self.sinks = sinks or [] # [OutputSink, ...]
+        self.timeout = timeout # Seconds allowed per command, None for no limit
+        self.tick = tick # Longest the loop sleeps between checks
+        self._cancelled = threading.Event()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    def run(self, items, completed=None):
+        self.completed = completed or set()
+        graph = InstallGraph(items)
+        self.scheduler.prepare(graph)
+        results = dict((id, ItemResult(id)) for id in items)
+        remaining = dict((id, len(deps)) for id, deps in graph.depends.items())
+        ready = graph.roots()
+        running = {} # { id: RunningCommand, ... }
+        poller = makePoller()
+        outstanding = len(items)
+        self._cancelled.clear()
+        self._devnull = open(os.devnull)
+
+        try:
+            while outstanding:
+                if self.cancelled():
+                    outstanding -= self._cancelAll(graph, results, ready, running, poller)
+                    continue
+
+                while ready and len(running) < self.workers:
+                    id = self.nextReady(graph, ready)
+                    ready.remove(id)
+                    self._notify("itemStarted", id)
+                    results[id].started = time.time()
+                    state = RunningCommand(graph.items[id], results[id],
+                                           iter(list(graph.items[id].commands.items())))
+                    running[id] = state
+
+                    if not self._startNext(state, poller):
+                        # Nothing to run, or it couldn't be started
+                        self._finishItem(state)
+
+                for key, data in poller.poll(self._waitTime(running)):
+                    self._handleOutput(key, data, poller)
+
+                self._checkTimeouts(running, poller)
+
+                for id, state in list(running.items()):
+                    if state.process is not None and not state.open:
+                        if not self._finishCommand(state):
+                            # Closed its output, but still running. It's
+                            # reaped on a later pass, so as not to hold up
+                            # everything else.
+                            continue
+
+                        if not self._startNext(state, poller):
+                            self._finishItem(state)
+
+                    if state.result.finished is None:
+                        continue
+
+                    # The item's done, one way or another
+                    del running[id]
+                    outstanding -= 1
+                    self._notify("itemFinished", state.result)
+
+                    if state.result.succeeded():
+                        for dependent in graph.dependents[id]:
+                            remaining[dependent] -= 1
+
+                            if not remaining[dependent]:
+                                ready.append(dependent)
+                    else:
+                        outstanding -= self._skipDependents(graph, results, id)
+        finally:
+            for state in running.values():
+                self._kill(state)
+
+            for sink in self.sinks:
+                sink.close()
+
+            self._devnull.close()
+
+        return results
+
+    def _waitTime(self, running):
+        wait = self.tick
+        now = time.time()
+
+        for state in running.values():
+            if state.result.finished is not None:
+                # Done without a process to wait on, e.g. every command was
+                # completed by an earlier run, so collect it straight away
+                return 0
+
+            if state.deadline is not None:
+                wait = min(wait, max(0, state.deadline - now))
+
+            if state.process is not None and not state.open:
+                wait = min(wait, REAPINTERVAL)
+
+        return wait
+
+    def _startNext(self, state, poller):
+        # Launch the item's next command, returning False when there are no
+        # more to run or the previous one failed.
+        if state.cmdresult is not None and state.cmdresult.exitcode:
+            return False
+
+        for name, command in state.commands:
+            state.cmdresult = CommandResult(name, command)
+            state.result.commands.append(state.cmdresult)
+
+            if self.resumeCommand(state.item, state.cmdresult):
+                continue
+
+            state.cmdresult.started = time.time()
+
+            try:
+                # Each command gets its own process group, so that a timeout
+                # or cancel also takes out anything the shell started.
+                state.process = subprocess.Popen(command, shell=True,
+                    cwd=state.item.cwd, stdin=self._devnull,
+                    stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                    preexec_fn=getattr(os, "setsid", None))
+            except Exception:
+                # Couldn't even be started
+                state.process = None
+                state.cmdresult.exitcode = -1
+                state.cmdresult.finished = time.time()
+                state.result.exitcode = -1
+                self.recordCommand(state.item, state.cmdresult)
+                return False
+
+            if self.timeout is not None:
+                state.deadline = state.cmdresult.started + self.timeout
+
+            state.open = set(["stdout", "stderr"])
+            poller.register(state.process.stdout, (state, "stdout"))
+            poller.register(state.process.stderr, (state, "stderr"))
+            return True
+
+        return False
+
+    def _handleOutput(self, key, data, poller):
+        state, stream = key
+
+        if not stream in state.open:
+            # Already abandoned
+            return
+
+        if not data:
+            # Closed; flush whatever was left without a newline
+            if state.partial[stream]:
+                self._emit(state, stream, state.partial[stream])
+                state.partial[stream] = ""
+
+            poller.unregister(getattr(state.process, stream))
+            getattr(state.process, stream).close()
+            state.open.discard(stream)
+            return
+
+        lines = (state.partial[stream] + data).split("\n")
+        state.partial[stream] = lines.pop()
+
+        for line in lines:
+            self._emit(state, stream, line.rstrip("\r"))
+
+    def _emit(self, state, stream, text):
+        for sink in self.sinks:
+            sink.line(state.item.id, state.cmdresult.name, stream, text)
+
+    def _checkTimeouts(self, running, poller):
+        now = time.time()
+
+        for state in running.values():
+            # Whether or not its output's still open, as a command may close
+            # it and carry on
+            if state.deadline is not None and now >= state.deadline and \
+               state.process is not None:
+                state.cmdresult.timedout = True
+                state.deadline = None
+                self._abandon(state, poller)
+
+    def _kill(self, state):
+        # Not Popen.poll, which would reap the child and lose its usage
+        if state.process is None or state.process.returncode is not None:
+            return
+
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(state.process.pid, signal.SIGKILL)
+            else:
+                state.process.kill()
+        except OSError:
+            # Exited in the meantime
+            pass
+
+    def _abandon(self, state, poller):
+        # Kill the current command and stop listening to it, rather than
+        # waiting for its output to be closed.
+        self._kill(state)
+
+        for stream in list(state.open):
+            poller.unregister(getattr(state.process, stream))
+            getattr(state.process, stream).close()
+
+        state.open = set()
+
+    def _finishCommand(self, state, block=False):
+        # Reap the current command, returning False if it's still running
+        # and block isn't set
+        status = waitProcess(state.process, block)
+
+        if status is None:
+            return False
+
+        exitcode, state.cmdresult.cputime, state.cmdresult.maxrss = status
+
+        if state.cmdresult.timedout and not exitcode:
+            exitcode = -1
+
+        state.cmdresult.exitcode = exitcode
+        state.cmdresult.finished = time.time()
+        state.result.exitcode = exitcode
+        self.recordCommand(state.item, state.cmdresult)
+        state.process = None
+        state.deadline = None
+        return True
+
+    def _finishItem(self, state):
+        state.result.finished = time.time()
+
+    def _cancelAll(self, graph, results, ready, running, poller):
+        # Stop everything that's running and skip everything that isn't,
+        # returning how many items that accounts for.
+        count = 0
+
+        for id, state in list(running.items()):
+            if state.process is not None:
+                self._abandon(state, poller)
+                self._finishCommand(state, True)
+
+            state.result.cancelled = True
+            self._finishItem(state)
+            del running[id]
+            count += 1
+            self._notify("itemFinished", state.result)
+
+        for id, result in results.items():
+            if result.started is None and not result.skipped:
+                result.skipped = True
+                result.cancelled = True
+                count += 1
+                self._notify("itemFinished", result)
+
+        del ready[:]
+        return count
@@ -0,0 +1,78 @@
+try:
+    # Python 2.x
+    import ConfigParser
+except(ImportError):
+    # Python 3.x
+    import configparser as ConfigParser
+
+import collections
+import threading
+import zlib
+
+from infoparser import readInfo
+
+# Long, rarely shown fields of an info file's [Core] section, with their
+# defaults. They're read from the file when first shown, not kept around.
+FIELDS = {
+    "tooltip": None,
+    "helptext": "<i>No information is available for this item</i>",
+}
+
+# Info files whose fields are kept at once
+CACHESIZE = 64
+
+def readFields(filename):
+    # { field: value, ... } of FIELDS, from an info file
+    try:
+        parser = readInfo(filename, {"Core": set(FIELDS)})
+    except ConfigParser.Error:
+        parser = None
+
+    fields = dict(FIELDS)
+
+    if parser is not None and parser.has_section("Core"):
+        for field in FIELDS:
+            if parser.has_option("Core", field):
+                fields[field] = parser.get("Core", field)
+
+    return fields
+
+def fieldsChecksum(fields):
+    # Cheap fingerprint of the fields, so an edit to just them is still
+    # noticed as a change to the file
+    return zlib.crc32("\0".join(fields.get(x) or "" for x in sorted(FIELDS))) & 0xffffffff
+
+class TextCache(object):
+    """Least recently used cache of FIELDS, by info file"""
+
+    def __init__(self, size=CACHESIZE, reader=readFields):
+        self.size = size
+        self.reader = reader # Callable taking a filename, returning a dict
+        self.entries = collections.OrderedDict() # { filename: fields, ... }, oldest first
+        self._lock = threading.Lock()
+
+    def get(self, filename, field):
+        with self._lock:
+            fields = self.entries.pop(filename, None)
+
+            if fields is None:
+                fields = self.reader(filename)
+
+            self.entries[filename] = fields
+
+            while len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+        return fields.get(field, FIELDS.get(field))
+
+    def forget(self, filename):
+        # The file's changed or gone
+        with self._lock:
+            self.entries.pop(filename, None)
+
+    def clear(self):
+        with self._lock:
+            self.entries.clear()
+
+# Shared by every item
+itemTexts = TextCache()
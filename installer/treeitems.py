@@ -1,6 +1,16 @@
 import collections
 
+from texts import itemTexts
+
+# Shared by every item with no children, radio buttons or dependencies
+EMPTY = ()
+
+# Stands in for a field that's read from the item's source file when needed
+LAZY = object()
+
 class PresetItem(object):
+    __slots__ = ("id", "parentid", "name", "includes", "excludes")
+
     def __init__(self, id=None):
         self.id = id
         self.parentid = None
@@ -8,37 +18,164 @@ class PresetItem(object):
         self.includes = []
         self.excludes = []
 
+class ItemData(object):
+    """The one record of an item: what's shown about it, how it installs, and
+    where it's placed in the tree. However many categories the item is in,
+    there's one of these, referred to by a lightweight node per category."""
+    __slots__ = ("id", "name", "summary", "cwd", "depends", "checkType", "commands",
+                 "placements", "selection", "source", "_tooltip", "_helptext")
+
+    def __init__(self, id=None, source=None):
+        self.id = id
+        self.name = None # Human-friendly name (string)
+        self.summary = None # Small quip about the object
+        self.cwd = None # Absolute directory for this entry
+        self.depends = EMPTY
+        self.checkType = None
+        self.commands = EMPTY
+        self.placements = EMPTY # [InstallItem, ...], one per category it's in
+        self.selection = None # SelectionState holding the checked state, if any
+        self.source = source # Info file the tooltip and help text come from
+
+        if source is None:
+            self._tooltip = None # String
+            self._helptext = "<i>No information is available for this item.</i>" # Longer explanation of this entry
+        else:
+            self._tooltip = self._helptext = LAZY
+
+    def _lazyField(name):
+        # Property reading the field from the source file on first use, via
+        # an LRU cache, unless it's been set outright
+        def get(self):
+            value = getattr(self, "_" + name)
+
+            if value is LAZY:
+                return itemTexts.get(self.source, name)
+
+            return value
+
+        def put(self, value):
+            setattr(self, "_" + name, value)
+
+        return property(get, put)
+
+    tooltip = _lazyField("tooltip")
+    helptext = _lazyField("helptext")
+    del _lazyField
+
+    def addPlacement(self, item):
+        if self.placements is EMPTY:
+            self.placements = []
+
+        self.placements.append(item)
+
+def _dataField(name):
+    # Property passing through to the item's shared ItemData
+    def get(self):
+        return getattr(self.payload, name)
+
+    def put(self, value):
+        setattr(self.payload, name, value)
+
+    return property(get, put)
+
 class TreeItem(object):
     """An item displayed within the TreeView"""
+    __slots__ = ("parentItem", "id", "childItems", "radioGroup", "payload",
+                 "pendingItems", "loaded", "_row", "_checkState")
+
     REGULARITEM = None
     CHECKBOXITEM = 1
     RADIOBUTTONITEM = 2
     
-    def __init__(self, id=None):
-        self.parentID = None # ID of parent item
+    def __init__(self, id=None, payload=None):
         self.parentItem = None # Instance of parent item
         self.id = id # Internal identifier (string)
-        self.childItems = []
-        
-        self.name = None # Human-friendly name (string)
-        self.summary = None # Small quip about the object
-        self.tooltip = None # String
-        self.helptext = "<i>No information is available for this item.</i>" # Longer explanation of this entry
-        self.cwd = None # Absolute directory for this entry
-        self.depends = []
-        self.dependedby = []
-        
-        self.checkType = None
-        self.checkState = False
-        self.radioGroup = [] # Used for childItems to add themselves to parents
+        self.childItems = EMPTY # Becomes a list with the first child
+        self.radioGroup = EMPTY # Used for childItems to add themselves to parents
+        self.payload = payload if payload is not None else ItemData()
+        self.pendingItems = EMPTY # Children not handed to the view yet
+        self.loaded = True # False until the view first asks for the children
+        self._row = 0 # Position within parentItem.childItems, kept up to date by the parent
+        self._checkState = False
+    
+    name = _dataField("name")
+    summary = _dataField("summary")
+    tooltip = _dataField("tooltip")
+    helptext = _dataField("helptext")
+    cwd = _dataField("cwd")
+    depends = _dataField("depends")
+    checkType = _dataField("checkType")
+    selection = _dataField("selection")
     
     def printChildren(self, level=1):
         for child in self.childItems:
             child.printChildren(level + 1)
             
     def appendChild(self, item):
+        if self.childItems is EMPTY:
+            self.childItems = []
+            
+        item._row = len(self.childItems)
+        item.parentItem = self
         self.childItems.append(item)
 
+    def insertChild(self, row, item):
+        if self.childItems is EMPTY:
+            self.childItems = []
+            
+        item.parentItem = self
+        self.childItems.insert(row, item)
+        self._renumber(row)
+
+    def deferChild(self, item):
+        # Add a child, but hold it back until fetchChildren. It already counts
+        # as this item's child, just without a row.
+        if self.pendingItems is EMPTY:
+            self.pendingItems = []
+            
+        item._row = -1
+        item.parentItem = self
+        self.pendingItems.append(item)
+
+    def fetchChildren(self, count):
+        # Move up to count held back children into childItems, returning how
+        # many were moved
+        fetched = self.pendingItems[:count]
+        del self.pendingItems[:count]
+        self.loaded = True
+        
+        for item in fetched:
+            self.appendChild(item)
+            
+        return len(fetched)
+
+    def removeChild(self, item):
+        row = item.row()
+        
+        if row < 0:
+            self.pendingItems.remove(item)
+        else:
+            del self.childItems[row]
+            self._renumber(row)
+        
+        if item in self.radioGroup:
+            self.radioGroup.remove(item)
+            
+        item.parentItem = None
+        item._row = 0
+
+    def addRadioItem(self, item):
+        if self.radioGroup is EMPTY:
+            self.radioGroup = []
+            
+        self.radioGroup.append(item)
+
+    def _renumber(self, first):
+        # Children from first on have moved
+        for row in range(first, len(self.childItems)):
+            self.childItems[row]._row = row
+
     def child(self, row):
         return self.childItems[row]
 
@@ -58,11 +195,27 @@ class TreeItem(object):
         return self.parentItem
 
     def row(self):
-        if self.parentItem and self in self.parentItem.childItems:
-            return self.parentItem.childItems.index(self)
+        # Constant time, as the model asks for it for every index it builds.
+        # -1 for children held back by deferChild.
+        if self.parentItem is not None:
+            return self._row
 
         return 0
     
+    def _getCheckState(self):
+        if self.selection is not None:
+            return self.selection.isSet(self.id)
+        
+        return self._checkState
+    
+    def _putCheckState(self, state):
+        if self.selection is not None:
+            self.selection.set(self.id, state)
+        else:
+            self._checkState = state
+            
+    checkState = property(_getCheckState, _putCheckState)
+    
     def isChecked(self):
         return self.checkState
     
@@ -98,6 +251,13 @@ class TreeItem(object):
             item.setChecked(False, True)
     
 class InstallItem(TreeItem):
-    def __init__(self, id):
-        super(self.__class__, self).__init__(id)
-        self.commands = collections.OrderedDict() # { 0: "cmd", 1: "cmd2", ... }
\ No newline at end of file
+    __slots__ = ("category",)
+    
+    def __init__(self, id, payload=None):
+        super(InstallItem, self).__init__(id, payload)
+        self.category = None # The category path this copy is placed under
+        
+        if payload is None:
+            self.commands = collections.OrderedDict() # { 0: "cmd", 1: "cmd2", ... }
+            
+    commands = _dataField("commands")
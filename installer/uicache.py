@@ -0,0 +1,127 @@
+try:
+    # Python 2.x
+    from cStringIO import StringIO
+except(ImportError):
+    # Python 3.x
+    from io import StringIO
+
+import hashlib
+import imp
+import os
+import sys
+import time
+
+HASHPREFIX = "# Source hash: "
+COSTPREFIX = "# Compile time: "
+
+# Lines at the top of a generated form searched for the header. It goes
+# after uic's coding declaration, which Python only looks for on the
+# first two lines.
+HEADERLINES = 5
+
+def cacheDir():
+    # Per user directory the generated forms are kept in, so neither the
+    # package nor a tracked source file is written to
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+
+    return os.path.join(base, "pynstaller")
+
+def fileHash(filename):
+    with open(filename, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+def readHeader(pyfile):
+    # (source hash, milliseconds the compile took) noted at the top of a
+    # generated form, or (None, None) if it's missing or wasn't made by us
+    digest = cost = None
+
+    try:
+        with open(pyfile) as f:
+            for x in range(HEADERLINES):
+                line = f.readline().rstrip("\r\n")
+
+                if line.startswith(HASHPREFIX):
+                    digest = line[len(HASHPREFIX):]
+                elif line.startswith(COSTPREFIX):
+                    cost = float(line[len(COSTPREFIX):].split()[0])
+    except (IOError, ValueError):
+        pass
+
+    return digest, cost
+
+def compileForm(uifile, pyfile, digest):
+    # Regenerate pyfile from uifile, returning how long uic took in
+    # milliseconds, which is what every launch used to pay.
+    from PyQt4 import uic
+
+    start = time.time()
+    code = StringIO()
+    uic.compileUi(uifile, code)
+    code = code.getvalue()
+    compile(code, pyfile, "exec")
+    cost = (time.time() - start) * 1000
+
+    # Keep the coding declaration first
+    coding = ""
+
+    if code.startswith("#") and "coding" in code.split("\n", 1)[0]:
+        coding, code = code.split("\n", 1)
+        coding += "\n"
+
+    directory = os.path.dirname(pyfile)
+
+    if directory and not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    tmpname = pyfile + ".tmp"
+
+    with open(tmpname, "w") as f:
+        f.write(coding)
+        f.write("%s%s\n%s%.1f ms\n" % (HASHPREFIX, digest, COSTPREFIX, cost))
+        f.write(code)
+
+    if os.path.exists(pyfile):
+        # No atomic replace on Windows
+        os.remove(pyfile)
+
+    os.rename(tmpname, pyfile)
+
+    # The .pyc's timestamp only has a resolution of a second
+    if os.path.exists(pyfile + "c"):
+        os.remove(pyfile + "c")
+
+    return cost
+
+def loadForm(uifile, pyfile=None, classname="Ui_Wizard", report=None):
+    # Return the form class from the module generated from uifile, by
+    # default kept in cacheDir(), regenerating it first only if uifile has
+    # changed since. Falls back to compiling in memory, as uic.loadUiType
+    # does, if the module can't be written.
+    start = time.time()
+    name = os.path.splitext(os.path.basename(uifile))[0]
+    pyfile = pyfile or os.path.join(cacheDir(), name + ".py")
+    digest = fileHash(uifile)
+    stored, cost = readHeader(pyfile)
+
+    if stored != digest:
+        try:
+            compileForm(uifile, pyfile, digest)
+        except (IOError, OSError):
+            from PyQt4 import uic
+            return uic.loadUiType(uifile)[0]
+
+        cost = None # Nothing saved this time
+
+    # Loaded as part of this package, so the form's implicit relative
+    # imports, such as "from mixedtreeview import ...", find its modules
+    package = __name__.rpartition(".")[0]
+    module = "%s._form_%s" % (package, name) if package else "_form_" + name
+    form = getattr(imp.load_source(module, pyfile), classname)
+
+    if report is not None and cost is not None:
+        report.saved("ui compile", cost - (time.time() - start) * 1000)
+
+    return form
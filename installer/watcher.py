@@ -0,0 +1,162 @@
+try:
+    # Linux only, and optional
+    import pyinotify
+except(ImportError):
+    pyinotify = None
+
+import os
+import threading
+import time
+
+from cache import fileSignature
+from discovery import iterDirectory
+
+class PollingBackend(object):
+    """Finds changed files by periodically comparing a snapshot of the
+    directory tree. Works everywhere, at the cost of a walk per interval."""
+
+    def __init__(self, directory, extension, touch, interval=2.0):
+        self.directory = directory
+        self.extension = extension
+        self.touch = touch # Callable taking the path of a touched file
+        self.interval = interval
+        self.snapshot = self.takeSnapshot()
+
+    def takeSnapshot(self):
+        snapshot = {}
+        pending = [self.directory]
+
+        while pending:
+            curdir = pending.pop()
+
+            try:
+                entries = list(iterDirectory(curdir))
+            except OSError:
+                continue
+
+            for name, path, isdir, stat in entries:
+                if isdir:
+                    pending.append(path)
+                elif name.endswith(self.extension):
+                    try:
+                        snapshot[path] = fileSignature(stat())
+                    except OSError:
+                        pass
+
+        return snapshot
+
+    def wait(self, stop):
+        # Sleep out the interval, then report whatever changed
+        if stop.wait(self.interval):
+            return
+
+        snapshot = self.takeSnapshot()
+
+        for path in set(snapshot) | set(self.snapshot):
+            if snapshot.get(path) != self.snapshot.get(path):
+                self.touch(path)
+
+        self.snapshot = snapshot
+
+    def close(self):
+        pass
+
+if pyinotify is not None:
+    class _InotifyHandler(pyinotify.ProcessEvent):
+        def my_init(self, backend):
+            self.backend = backend
+
+        def process_default(self, event):
+            # Directories are passed along whole, as moving one in or out
+            # of the tree only generates a single event for it.
+            if event.dir or event.pathname.endswith(self.backend.extension):
+                self.backend.touch(event.pathname)
+
+class InotifyBackend(object):
+    """Gets told about changed files by the kernel, through pyinotify"""
+
+    MASK = 0
+    if pyinotify is not None:
+        MASK = pyinotify.IN_CLOSE_WRITE | pyinotify.IN_CREATE | \
+               pyinotify.IN_DELETE | pyinotify.IN_MOVED_FROM | \
+               pyinotify.IN_MOVED_TO | pyinotify.IN_MODIFY
+
+    def __init__(self, directory, extension, touch, interval=0.25):
+        self.directory = directory
+        self.extension = extension
+        self.touch = touch
+        self.manager = pyinotify.WatchManager()
+        self.notifier = pyinotify.Notifier(self.manager,
+            _InotifyHandler(backend=self), timeout=int(interval * 1000))
+        self.manager.add_watch(directory, self.MASK, rec=True, auto_add=True)
+
+    def wait(self, stop):
+        if self.notifier.check_events():
+            self.notifier.read_events()
+            self.notifier.process_events()
+
+    def close(self):
+        self.notifier.stop()
+
+class CatalogWatcher(object):
+    """Watches a directory tree for added, changed or removed files with a
+    given extension. Bursts of changes are collected until things have been
+    quiet for `debounce` seconds, then handed to the callback as one sorted
+    list of paths. The callback runs on the watcher's own thread."""
+
+    def __init__(self, directory, extension, callback, debounce=0.5,
+                 polling=None, interval=2.0):
+        self.directory = os.path.abspath(directory)
+        self.extension = extension
+        self.callback = callback
+        self.debounce = debounce
+        self.polling = polling # None picks inotify when available
+        self.interval = interval # Seconds between polls, without inotify
+
+        self._pending = set()
+        self._lastevent = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self.backend = None
+
+    def touch(self, path):
+        with self._lock:
+            self._pending.add(path)
+            self._lastevent = time.time()
+
+    def start(self):
+        if self.polling or (self.polling is None and pyinotify is None):
+            self.backend = PollingBackend(self.directory, self.extension,
+                                          self.touch, self.interval)
+        else:
+            self.backend = InotifyBackend(self.directory, self.extension, self.touch)
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+        if self.backend is not None:
+            self.backend.close()
+            self.backend = None
+
+    def _run(self):
+        while not self._stop.is_set():
+            self.backend.wait(self._stop)
+
+            with self._lock:
+                if not self._pending or time.time() - self._lastevent < self.debounce:
+                    continue
+
+                paths = sorted(self._pending)
+                self._pending = set()
+
+            self.callback(paths)
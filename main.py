@@ -1,15 +1,40 @@
 if __name__ == "__main__":
     import sys, os
     
-    from PyQt4 import QtCore, QtGui
+    from installer.startup import report
     
-    from installer.core import Core
+    # --timings prints how long starting up took, --trace FILE (or the
+    # equivalent environment variables) also saves it as a Chrome trace
+    tracefile = os.environ.get("PYNSTALLER_TRACE")
     
-    if not hasattr(sys, "frozen"):
-        from PyQt4 import uic
-        form_class, base_class = uic.loadUiType(r"installer\gui_main.ui")
-    else:
-        from installer.gui_main import Ui_Wizard as form_class
+    if "--trace" in sys.argv[:-1]:
+        tracefile = sys.argv[sys.argv.index("--trace") + 1]
+    
+    if tracefile or "--timings" in sys.argv or os.environ.get("PYNSTALLER_TIMINGS"):
+        report.enable(tracefile)
+    
+    with report.phase("import Qt"):
+        from PyQt4 import QtCore, QtGui
+    
+    with report.phase("import installer"):
+        from installer.core import Core, DependencyCycleError
+        from installer.resources import registerResources
+        from installer.watcher import CatalogWatcher
+        from installer.history import formatDuration
+    
+    with report.phase("register resources"):
+        registerResources()
+    
+    with report.phase("load form"):
+        if not hasattr(sys, "frozen"):
+            from installer.uicache import loadForm
+            
+            # Use a module generated into the user's cache, only running uic
+            # when the .ui changes
+            basedir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "installer")
+            form_class = loadForm(os.path.join(basedir, "gui_main.ui"), report=report)
+        else:
+            from installer.gui_main import Ui_Wizard as form_class
     
     def makeDirExist(dir):
         if os.path.exists(dir):
@@ -25,6 +50,9 @@ if __name__ == "__main__":
                 return False
     
     class MainForm(QtGui.QWizard, form_class):
+        # Emitted from the watcher's thread, delivered on the GUI thread
+        catalogChanged = QtCore.pyqtSignal(object)
+        
         def __init__(self, core, parent=None):
             super(self.__class__, self).__init__(parent)
             self.setupUi(self)
@@ -36,10 +64,35 @@ if __name__ == "__main__":
             self.installerTreeView.model.checkStateChangeRequest.connect(self.itemChecked)
             
             self.introPage.setPixmap(QtGui.QWizard.WatermarkPixmap,
-                    QtGui.QPixmap(':/App/images/watermark1.png'))
+                    QtGui.QPixmap('App:images/watermark1.png'))
             
             self.btnLoadPreset.clicked.connect(self.loadPreset)
             
+            self.watcher = None
+            self.catalogChanged.connect(self.reloadItems)
+            
+            self.selectionSubTitle = self.selectionPage.subTitle()
+            
+        def watchItems(self):
+            # Pick up edits to info files while the wizard stays open
+            self.watcher = CatalogWatcher(self.core.installerdir,
+                self.core.installerfileext, self.catalogChanged.emit)
+            self.watcher.start()
+            
+        def reloadItems(self, paths):
+            self.core.refresh(paths)
+            self.updateEstimate()
+            
+        def updateEstimate(self):
+            # Let the operator know roughly how long the selection will take
+            estimate = self.core.estimate()
+            
+            if estimate is None:
+                self.selectionPage.setSubTitle(self.selectionSubTitle)
+            else:
+                self.selectionPage.setSubTitle("%s Installing will take %s." %
+                    (self.selectionSubTitle, formatDuration(estimate)))
+            
         def itemClicked(self, item):
             i = item.internalPointer()
             self.helpPanel.setHtml(i.helptext)
@@ -53,16 +106,23 @@ if __name__ == "__main__":
             missingdeps = []
             dependedby = []
             disableddeps = []
-            
-            depends = self.core.installerItems().deps(thisitem.id)
+            depends = [] # Only needed, and only worked out, when checking
             
             if newstate == True:
+                try:
+                    depends = self.core.installerItems().deps(thisitem.id)
+                except DependencyCycleError as e:
+                    QtGui.QMessageBox.critical(self, "Circular dependencies!", 
+                       "Can't check this item, as its dependencies loop:\n\n%s" %
+                       " -> ".join(e.path))
+                    return
+                
                 for dep in depends:
                     if not dep in self.core.installerItems():
                         missingdeps.append(dep)
                         docheck = False
             else:
-                for dep in thisitem.dependedby:
+                for dep in self.core.installerItems().dependents(thisitem.id):
                     if self.core.installerItems().isChecked(dep):
                         dependedby.append(dep)
                         docheck = False
@@ -103,36 +163,57 @@ if __name__ == "__main__":
                                 self.core.installerItems().setChecked(dep, False)
                     
                     self.core.installerItems().setChecked(thisitem.id, False)
+                    
+            self.updateEstimate()
                                 
         def parseConfig(self):
-            self.installerTreeView.parseData(self.core)
-            for key, value in self.core.presetItems().iteritems():
-                self.cmbPresets.addItem(value.name, key)
+            with report.phase("MixedTreeModel.dataInit", "gui"):
+                self.installerTreeView.parseData(self.core)
+                
+            with report.phase("fill presets", "gui"):
+                for key, value in self.core.presetItems().iteritems():
+                    self.cmbPresets.addItem(value.name, key)
                 
             if "default" in self.core.presetItems():
-                self.btnLoadPreset.click()
+                with report.phase("load default preset", "gui"):
+                    self.btnLoadPreset.click()
+                    
+        def startupFinished(self):
+            # The event loop's running, so the window's really up
+            report.mark("event loop started")
+            report.write()
+            report.writeTrace()
     
         def loadPreset(self):
             presetid = str(self.cmbPresets.itemData(self.cmbPresets.currentIndex()).toString())
-            preset = self.core.presetItems()[presetid]
-            
-            for x in preset.includes:
-                item = self.core.installerItems().setChecked(x, True)
+            self.core.applyPreset(presetid)
                 
-            for x in preset.excludes:
-                item = self.core.installerItems().setChecked(x, False)
+            self.updateEstimate()
                 
-    app = QtGui.QApplication(sys.argv)
+    with report.phase("create application"):
+        app = QtGui.QApplication(sys.argv)
     
     makeDirExist("Installers")
     makeDirExist("Presets")
     
-    core = Core()
-    core.getItems("Installers")
-    core.getPresets("Presets")
+    with report.phase("scan catalog"):
+        # Categories are only filled in as they're expanded
+        core = Core(lazy=True)
+        core.scanCatalog("Installers", "Presets")
+    
+    with report.phase("create window"):
+        myapp = MainForm(core)
+        
+    with report.phase("MainForm.parseConfig"):
+        myapp.parseConfig()
     
-    myapp = MainForm(core)
-    myapp.parseConfig()
-    myapp.show()
+    if "--watch" in sys.argv or os.environ.get("PYNSTALLER_WATCH"):
+        myapp.watchItems()
+        
+    with report.phase("show window"):
+        myapp.show()
+        
+    if report.enabled:
+        QtCore.QTimer.singleShot(0, myapp.startupFinished)
     
     sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,114 @@
+try:
+    # Python 2.x
+    import ConfigParser
+except(ImportError):
+    # Python 3.x
+    import configparser as ConfigParser
+
+import glob
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, os.path.join(ROOT, "installer"))
+
+from infoparser import readInfo, readConfigParser, ITEMKEYS, PRESETKEYS
+
+# The reader follows Python 2's ConfigParser, which the installer runs on.
+# Python 3's treats comments, "rem" lines and duplicates differently.
+PYTHON3 = sys.version_info[0] > 2
+
+# Files the purpose-built reader has to get exactly as SafeConfigParser does
+EDGECASES = {
+    "comments": "[Core]\nname = A ; comment\nid=a\nsummary = x;y\nrem this\n; c\n# c\nREM that\n",
+    "continuation": "[Core]\nid=b\ndepends = b,\n  c\n\tdone\nhelptext = a\n  b\n",
+    "duplicates": "[Core]\nid=c\nname=first\nNAME = second\n[Commands]\n2=two\n1 = one\n2=TWO\n",
+    "sections": "[Core]\nname=\"\"\nid=d\n[Other]\nq=1\n  more\n[Core]\nsummary=merged\n",
+    "noheader": "name=x\n[Core]\nid=e\n",
+    "garbage": "[Core]\nname=f\nid=f\ngarbage line\n",
+    "interpolation": "[Core]\nname=%(id)s\nid=g\n",
+    "default": "[DEFAULT]\nx=1\n[Core]\nname=h\nid=h\n[Commands]\ny=2\n",
+    "emptycommands": "[Core]\nname=i\nid=i\ncategories=A/B, C\nchecktype=2\n[Commands]\n",
+    "colons": "[Core]\nid: j\nname = a: b\nsummary: c = d\n",
+    "preset": "[Core]\nname=Default\nid=default\nincludes=a, b\nexcludes=c\n",
+}
+
+def snapshot(parser, wanted):
+    # What the core would see of a file: the wanted options of each wanted
+    # section, in order where every option's wanted
+    result = {}
+
+    for section, keys in sorted(wanted.items()):
+        if not parser.has_section(section):
+            result[section] = None
+        elif keys is None:
+            result[section] = parser.items(section)
+        else:
+            result[section] = [(x, parser.get(section, x)) for x in sorted(keys)
+                               if parser.has_option(section, x)]
+
+    return result
+
+def read(reader, filename, wanted):
+    try:
+        return snapshot(reader(filename), wanted)
+    except ConfigParser.Error:
+        return "error"
+
+class InfoParserTest(unittest.TestCase):
+    """readInfo gives the same results as SafeConfigParser"""
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp(prefix="pynstaller-test-")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def assertSame(self, filename, wanted):
+        self.assertEqual(read(lambda x: readInfo(x, wanted), filename, wanted),
+                         read(readConfigParser, filename, wanted), filename)
+
+    def write(self, name, text, newline="\n"):
+        filename = os.path.join(self.directory, name)
+
+        with open(filename, "wb") as f:
+            f.write(text.replace("\n", newline).encode("utf-8"))
+
+        return filename
+
+    def testShippedCatalog(self):
+        installers = glob.glob(os.path.join(ROOT, "Installers", "*", "*", "*.info"))
+        presets = glob.glob(os.path.join(ROOT, "Presets", "*.preset"))
+        self.assertTrue(installers and presets)
+
+        for filename in installers:
+            self.assertSame(filename, ITEMKEYS)
+
+        for filename in presets:
+            self.assertSame(filename, PRESETKEYS)
+
+    @unittest.skipIf(PYTHON3, "compares against Python 2's ConfigParser")
+    def testEdgeCases(self):
+        for name, text in sorted(EDGECASES.items()):
+            for wanted in (ITEMKEYS, PRESETKEYS):
+                self.assertSame(self.write(name + ".info", text), wanted)
+
+    @unittest.skipIf(PYTHON3, "compares against Python 2's ConfigParser")
+    def testWindowsLineEndings(self):
+        for name, text in sorted(EDGECASES.items()):
+            self.assertSame(self.write(name + ".info", text, "\r\n"), ITEMKEYS)
+
+    def testMissingFile(self):
+        self.assertSame(os.path.join(self.directory, "missing.info"), ITEMKEYS)
+
+    def testFallback(self):
+        # Only SafeConfigParser gets these right, so they're handed to it
+        for name in ("interpolation", "default"):
+            parser = readInfo(self.write(name + ".info", EDGECASES[name]), ITEMKEYS)
+            self.assertTrue(isinstance(parser, ConfigParser.RawConfigParser))
+
+if __name__ == "__main__":
+    unittest.main()
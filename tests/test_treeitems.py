@@ -0,0 +1,134 @@
+import os
+import random
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "installer"))
+
+from treeitems import TreeItem, InstallItem
+
+def makeChildren(count, start=0):
+    return [InstallItem("item%d" % n) for n in range(start, start + count)]
+
+class TreeMutationTest(unittest.TestCase):
+    """Rows and parents stay right however the tree's changed"""
+
+    def assertRows(self, parent, expected=None):
+        # Every child knows where it is, and in the expected order if given
+        if expected is not None:
+            self.assertEqual([x.id for x in parent.childItems], [x.id for x in expected])
+
+        for index, child in enumerate(parent.childItems):
+            self.assertEqual(child.row(), index)
+            self.assertTrue(child.parentItem is parent)
+
+        for child in parent.pendingItems:
+            self.assertEqual(child.row(), -1)
+            self.assertTrue(child.parentItem is parent)
+
+    def testAppendChild(self):
+        parent = TreeItem("cat")
+        children = makeChildren(5)
+
+        for n, child in enumerate(children):
+            parent.appendChild(child)
+            self.assertRows(parent, children[:n + 1])
+
+        self.assertEqual(parent.childCount(), 5)
+
+    def testInsertChild(self):
+        parent = TreeItem("cat")
+        expected = makeChildren(3)
+
+        for child in expected:
+            parent.appendChild(child)
+
+        first, middle, last = makeChildren(3, 3)
+
+        parent.insertChild(0, first)
+        expected.insert(0, first)
+        self.assertRows(parent, expected)
+
+        parent.insertChild(2, middle)
+        expected.insert(2, middle)
+        self.assertRows(parent, expected)
+
+        parent.insertChild(parent.childCount(), last)
+        expected.append(last)
+        self.assertRows(parent, expected)
+
+    def testRemoveChild(self):
+        parent = TreeItem("cat")
+        expected = makeChildren(6)
+
+        for child in expected:
+            parent.appendChild(child)
+
+        for position in (0, 2, -1):
+            child = expected.pop(position)
+            parent.removeChild(child)
+            self.assertRows(parent, expected)
+            self.assertTrue(child.parentItem is None)
+
+    def testRemoveRadioChild(self):
+        parent = TreeItem("cat")
+        children = makeChildren(3)
+
+        for child in children:
+            parent.appendChild(child)
+            parent.addRadioItem(child)
+
+        parent.removeChild(children[1])
+        self.assertEqual(parent.radioGroup, [children[0], children[2]])
+        self.assertRows(parent, [children[0], children[2]])
+
+    def testDeferAndFetchChildren(self):
+        parent = TreeItem("cat")
+        parent.loaded = False
+        children = makeChildren(5)
+
+        for child in children:
+            parent.deferChild(child)
+
+        self.assertEqual(parent.childCount(), 0)
+        self.assertRows(parent, [])
+
+        self.assertEqual(parent.fetchChildren(2), 2)
+        self.assertTrue(parent.loaded)
+        self.assertRows(parent, children[:2])
+        self.assertEqual(parent.pendingItems, children[2:])
+
+        # A held back child can be removed before it's fetched
+        parent.removeChild(children[3])
+        self.assertTrue(children[3].parentItem is None)
+        self.assertRows(parent, children[:2])
+
+        self.assertEqual(parent.fetchChildren(10), 2)
+        self.assertRows(parent, children[:3] + children[4:])
+        self.assertEqual(len(parent.pendingItems), 0)
+        self.assertEqual(parent.fetchChildren(10), 0)
+
+    def testMixedMutations(self):
+        parent = TreeItem("cat")
+        expected = []
+        rng = random.Random(0)
+
+        for child in makeChildren(500):
+            operation = rng.random()
+
+            if operation < 0.5 or not expected:
+                parent.appendChild(child)
+                expected.append(child)
+            elif operation < 0.75:
+                row = rng.randrange(len(expected) + 1)
+                parent.insertChild(row, child)
+                expected.insert(row, child)
+            else:
+                removed = rng.choice(expected)
+                parent.removeChild(removed)
+                expected.remove(removed)
+
+            self.assertRows(parent, expected)
+
+if __name__ == "__main__":
+    unittest.main()